@@ -1,18 +1,11 @@
 from fastapi import APIRouter, Depends
-from fastapi_limiter.depends import RateLimiter
 
+from fastapi_application.api.dependencies.rate_limiter import create_rate_limiter
 from fastapi_application.core.config import settings
 from .api_v1 import router as router_api_v1
 
 router = APIRouter(
     prefix=settings.api.prefix,
-    dependencies=[
-        Depends(
-            RateLimiter(
-                times=settings.rate_limiter.times,
-                seconds=settings.rate_limiter.seconds,
-            ),
-        )
-    ],
+    dependencies=[Depends(create_rate_limiter())],
 )
 router.include_router(router_api_v1)
@@ -3,7 +3,9 @@ from datetime import datetime
 from dateutil.tz import UTC
 from fastapi import APIRouter, Depends
 from fastapi.security import HTTPBearer
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy import text
+from starlette.responses import Response
 
 from fastapi_application.api.api_v1.views.auth_views import auth_router
 from fastapi_application.api.api_v1.views.category_views import category_router
@@ -14,6 +16,8 @@ from fastapi_application.api.api_v1.views.product_views import product_router
 from fastapi_application.api.api_v1.views.user_views import user_router
 from fastapi_application.core.authentication.fa_users import current_active_superuser
 from fastapi_application.core.config import settings
+from redis_conf.circuit_breaker import redis_breaker
+from redis_conf.redis import AsyncRedisClient
 
 
 http_bearer = HTTPBearer(auto_error=False)
@@ -44,3 +48,18 @@ async def db_health_check(session: db_session):
         return {"database": "healthy"}
     except Exception as e:
         return {"database": "unhealthy", "error": str(e)}
+
+
+@router.get("/health/redis")
+async def redis_health_check():
+    try:
+        client = await AsyncRedisClient.get_client()
+        await client.ping()
+        return {"redis": "healthy", "circuit": redis_breaker.state}
+    except Exception as e:
+        return {"redis": "unhealthy", "circuit": redis_breaker.state, "error": str(e)}
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
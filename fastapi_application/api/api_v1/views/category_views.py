@@ -2,10 +2,19 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, APIRouter
-from fastapi_cache.decorator import cache
 from fastapi_pagination import Params
 
 from fastapi_application.core.config import settings
+from fastapi_application.core.schemas.bulk_schema import (
+    BulkCreateSchema,
+    BulkUpdateSchema,
+    BulkIdsSchema,
+)
+from fastapi_application.core.schemas.pagination_schema import (
+    CursorPageSchema,
+    PageSchema,
+)
+from fastapi_application.core.repositories.utils import CountStrategy
 from fastapi_application.core.schemas.category_schema import (
     CategorySchema,
     CategoryCreate,
@@ -16,6 +25,15 @@ from fastapi_application.core.schemas.category_schema import (
 from fastapi_application.core.services.category_service import CategoryService
 from fastapi_application.api.api_v1.views.main_dependencies_for_views import db_session
 from fastapi_application.api.api_v1.views.utils import run_crud_action
+from fastapi_application.core.models import Category
+from fastapi_application.core.cache import (
+    cache,
+    conditional_get,
+    evict_pending_tags,
+    list_version,
+    tagged_key_builder,
+    versioned_key_builder,
+)
 from fastapi_application.core.repositories.category_repository import (
     SQLAlchemyCategoryRepository,
 )
@@ -38,23 +56,48 @@ category_router = APIRouter(prefix=settings.api.v1.categories, tags=["Categories
 
 
 @category_router.get("/")
+@conditional_get(
+    list_version(Category),
+    unless=("keyset", "cursor"),
+)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Category),
+)
 async def get_categories(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
-) -> list[CategorySchema]:
+    keyset: bool = False,
+    cursor: str | None = None,
+) -> list[CategorySchema] | CursorPageSchema[CategorySchema]:
+    if keyset or cursor:
+        return await run_crud_action(
+            session,
+            category_service.get_categories_by_cursor,
+            CursorPageSchema[CategorySchema],
+            refresh=False,
+            limit=limit,
+            cursor=cursor,
+        )
+
     return await run_crud_action(
         session,
-        category_service.get_many_categories,
+        category_service.get_all_categories,
         CategorySchema,
         refresh=False,
         limit=limit,
         offset=offset,
+        projection=CategorySchema,
     )
 
 
 @category_router.get("/{category_id}")
-@cache(expire=300)
+@conditional_get(category_service.get_category_version, "category:{category_id}")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("category:{category_id}", entity=True),
+)
 async def get_category_by_id(
     session: db_session,
     category_id: UUID,
@@ -79,6 +122,7 @@ async def get_categories_by_ids(
         CategorySchema,
         refresh=False,
         category_ids=category_ids,
+        projection=CategorySchema,
     )
 
 
@@ -86,18 +130,27 @@ async def get_categories_by_ids(
 async def get_categories_with_pagination(
     session: db_session,
     params: Annotated[Params, Depends()],
-) -> list[CategorySchema]:
+    count: CountStrategy | None = None,
+) -> PageSchema[CategorySchema]:
     return await run_crud_action(
         session,
         category_service.get_categories_with_paginated,
-        CategorySchema,
+        PageSchema[CategorySchema],
         refresh=False,
         params=params,
+        count_strategy=count,
     )
 
 
 @category_router.get("/category_with_products/{category_id}")
-@cache(expire=300)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder(
+        "category:{category_id}",
+        "category_products:{category_id}",
+        "category_products",
+    ),
+)
 async def get_category_with_products(
     session: db_session,
     category_id: UUID,
@@ -124,6 +177,77 @@ async def create_category(
     )
 
 
+@category_router.post("/bulk")
+async def create_categories_bulk(
+    session: db_session,
+    categories_data: list[CategoryCreate],
+) -> BulkCreateSchema[CategorySchema]:
+    return await run_crud_action(
+        session,
+        category_service.create_many_categories,
+        BulkCreateSchema[CategorySchema],
+        refresh=False,
+        begin=False,
+        categories_data=categories_data,
+    )
+
+
+@category_router.patch("/bulk")
+async def update_categories_bulk(
+    session: db_session,
+    bulk_upd: BulkUpdateSchema[CategoryUpdatePartial],
+) -> BulkIdsSchema:
+    return await run_crud_action(
+        session,
+        category_service.update_many_categories,
+        BulkIdsSchema,
+        refresh=False,
+        bulk_upd=bulk_upd,
+    )
+
+
+@category_router.delete("/bulk")
+async def delete_categories_bulk(
+    session: db_session,
+    category_ids: list[UUID],
+) -> BulkIdsSchema:
+    return await run_crud_action(
+        session,
+        category_service.delete_many_categories,
+        BulkIdsSchema,
+        refresh=False,
+        category_ids=category_ids,
+    )
+
+
+@category_router.put("/bulk")
+async def upsert_categories_bulk(
+    session: db_session,
+    categories_data: list[CategoryCreate],
+) -> BulkCreateSchema[CategorySchema]:
+    return await run_crud_action(
+        session,
+        category_service.upsert_many_categories,
+        BulkCreateSchema[CategorySchema],
+        refresh=False,
+        categories_data=categories_data,
+    )
+
+
+@category_router.put("/by_name/{category_name}")
+async def upsert_category_by_name(
+    session: db_session,
+    category_name: str,
+) -> CategorySchema:
+    return await run_crud_action(
+        session,
+        category_service.upsert_category,
+        CategorySchema,
+        refresh=False,
+        category_name=category_name,
+    )
+
+
 @category_router.put("/{category_id}")
 async def update_category(
     session: db_session,
@@ -171,3 +295,5 @@ async def delete_category(
             session,
             category,
         )
+
+    await evict_pending_tags(session)
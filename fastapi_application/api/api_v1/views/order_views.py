@@ -2,10 +2,14 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, APIRouter
-from fastapi_cache.decorator import cache
 from fastapi_pagination import Params
 
 from fastapi_application.core.config import settings
+from fastapi_application.core.schemas.pagination_schema import (
+    CursorPageSchema,
+    PageSchema,
+)
+from fastapi_application.core.repositories.utils import CountStrategy
 from fastapi_application.core.schemas.order_schema import (
     OrderSchema,
     OrderSchemaWithProducts,
@@ -18,6 +22,16 @@ from fastapi_application.core.schemas.order_schema import (
 from fastapi_application.core.services.order_service import OrderService
 from fastapi_application.api.api_v1.views.main_dependencies_for_views import db_session
 from fastapi_application.api.api_v1.views.utils import run_crud_action
+from fastapi_application.core.models import Order, OrderProductAssociation, Product
+from fastapi_application.core.cache import (
+    cache,
+    conditional_get,
+    evict_pending_tags,
+    get_many_cached,
+    list_version,
+    tagged_key_builder,
+    versioned_key_builder,
+)
 from fastapi_application.core.repositories import obj_by_id_factory
 from fastapi_application.core.repositories.order_repository import (
     SQLAlchemyOrderRepository,
@@ -43,12 +57,40 @@ order_router = APIRouter(prefix=settings.api.v1.orders, tags=["Orders CRUD"])
 
 
 @order_router.get("/")
+@conditional_get(
+    list_version(Order, OrderProductAssociation, Product),
+    unless=("keyset", "cursor"),
+)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Order, OrderProductAssociation, Product),
+)
 async def get_orders(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
     with_assoc: bool = False,
-) -> list[OrderSchema] | list[OrderSchemaWithProducts]:
+    keyset: bool = False,
+    cursor: str | None = None,
+) -> (
+    list[OrderSchema]
+    | list[OrderSchemaWithProducts]
+    | CursorPageSchema[OrderSchema]
+    | CursorPageSchema[OrderSchemaWithProducts]
+):
+    if keyset or cursor:
+        return await run_crud_action(
+            session,
+            order_service.get_orders_by_cursor,
+            CursorPageSchema[
+                OrderSchemaWithProducts if with_assoc else OrderSchema
+            ],
+            refresh=False,
+            limit=limit,
+            cursor=cursor,
+            with_assoc=with_assoc,
+        )
+
     if with_assoc:
         return await run_crud_action(
             session,
@@ -68,11 +110,36 @@ async def get_orders(
         limit=limit,
         offset=offset,
         with_assoc=with_assoc,
+        projection=OrderSchema,
+    )
+
+
+@order_router.get("/paginated")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Order, OrderProductAssociation, Product),
+)
+async def get_orders_with_pagination(
+    session: db_session,
+    params: Annotated[Params, Depends()],
+    count: CountStrategy | None = None,
+) -> PageSchema[OrderSchema]:
+    return await run_crud_action(
+        session,
+        order_service.get_orders_with_paginated,
+        PageSchema[OrderSchema],
+        refresh=False,
+        params=params,
+        count_strategy=count,
     )
 
 
 @order_router.get("/{order_id}")
-@cache(expire=300)
+@conditional_get(order_service.get_order_version, "order:{order_id}")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("order:{order_id}", entity=True),
+)
 async def get_order_by_id(
     session: db_session,
     order_id: UUID,
@@ -102,28 +169,18 @@ async def get_orders_by_ids(
             with_assoc=with_assoc,
         )
 
-    return await run_crud_action(
-        session,
-        order_service.get_many_orders,
-        OrderSchema,
-        refresh=False,
-        order_ids=order_ids,
-        with_assoc=with_assoc,
-    )
-
+    async def fetch(ids: list[UUID]) -> list[OrderSchema]:
+        return await run_crud_action(
+            session,
+            order_service.get_many_orders,
+            OrderSchema,
+            refresh=False,
+            order_ids=ids,
+            with_assoc=with_assoc,
+            projection=OrderSchema,
+        )
 
-@order_router.get("/paginated")
-async def get_orders_with_pagination(
-    session: db_session,
-    params: Annotated[Params, Depends()],
-) -> list[OrderSchema]:
-    return await run_crud_action(
-        session,
-        order_service.get_orders_with_paginated,
-        OrderSchema,
-        refresh=False,
-        params=params,
-    )
+    return await get_many_cached(order_ids, "order:{}", fetch)
 
 
 @order_router.post("/")
@@ -144,25 +201,13 @@ async def create_order_with_products(
     session: db_session,
     order_data: OrderCreateWithProducts,
 ) -> OrderSchemaWithProducts:
-    if not session.in_transaction():
-        async with session.begin():
-            order = await order_service.create_order_with_products(
-                session,
-                order_data,
-            )
-    else:
-        order = await order_service.create_order_with_products(
-            session,
-            order_data,
-        )
-
-    await session.refresh(order)
-    order = await order_service.get_many_orders(
+    return await run_crud_action(
         session,
-        [order.id],
-        with_assoc=True,
+        order_service.create_order_with_products,
+        OrderSchemaWithProducts,
+        refresh=False,
+        order_data=order_data,
     )
-    return OrderSchemaWithProducts.model_validate(order[0])
 
 
 @order_router.put("/{order_id}")
@@ -206,6 +251,7 @@ async def update_order_with_products_partial(
         session,
         order_service.update_order_with_products_partial,
         OrderSchemaWithProducts,
+        refresh=False,
         order=order,
         order_upd=order_upd,
         partial=True,
@@ -222,3 +268,5 @@ async def delete_order(
             await order_service.delete_order(session, order)
     else:
         await order_service.delete_order(session, order)
+
+    await evict_pending_tags(session)
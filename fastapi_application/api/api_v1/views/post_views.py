@@ -2,10 +2,19 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, APIRouter
-from fastapi_cache.decorator import cache
 from fastapi_pagination import Params
 
 from fastapi_application.core.config import settings
+from fastapi_application.core.schemas.bulk_schema import (
+    BulkCreateSchema,
+    BulkUpdateSchema,
+    BulkIdsSchema,
+)
+from fastapi_application.core.schemas.pagination_schema import (
+    CursorPageSchema,
+    PageSchema,
+)
+from fastapi_application.core.repositories.utils import CountStrategy
 from fastapi_application.core.schemas.post_schema import (
     PostSchema,
     PostCreate,
@@ -16,6 +25,15 @@ from fastapi_application.core.schemas.post_schema import (
 from fastapi_application.core.services.post_service import PostService
 from fastapi_application.api.api_v1.views.main_dependencies_for_views import db_session
 from fastapi_application.api.api_v1.views.utils import run_crud_action
+from fastapi_application.core.models import Post
+from fastapi_application.core.cache import (
+    cache,
+    conditional_get,
+    evict_pending_tags,
+    list_version,
+    tagged_key_builder,
+    versioned_key_builder,
+)
 
 from fastapi_application.core.repositories import obj_by_id_factory
 from fastapi_application.core.repositories import (
@@ -34,11 +52,31 @@ post_service = PostService(post_repo=SQLAlchemyPostRepository())
 
 
 @post_router.get("/")
+@conditional_get(
+    list_version(Post),
+    unless=("keyset", "cursor"),
+)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Post),
+)
 async def get_posts(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
-) -> list[PostSchema]:
+    keyset: bool = False,
+    cursor: str | None = None,
+) -> list[PostSchema] | CursorPageSchema[PostSchema]:
+    if keyset or cursor:
+        return await run_crud_action(
+            session,
+            post_service.get_posts_by_cursor,
+            CursorPageSchema[PostSchema],
+            refresh=False,
+            limit=limit,
+            cursor=cursor,
+        )
+
     return await run_crud_action(
         session,
         post_service.get_all_posts,
@@ -46,11 +84,36 @@ async def get_posts(
         refresh=False,
         limit=limit,
         offset=offset,
+        projection=PostSchema,
+    )
+
+
+@post_router.get("/paginated")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Post),
+)
+async def get_posts_with_pagination(
+    session: db_session,
+    params: Annotated[Params, Depends()],
+    count: CountStrategy | None = None,
+) -> PageSchema[PostSchema]:
+    return await run_crud_action(
+        session,
+        post_service.get_posts_with_paginated,
+        PageSchema[PostSchema],
+        refresh=False,
+        params=params,
+        count_strategy=count,
     )
 
 
 @post_router.get("/{post_id}")
-@cache(expire=300)
+@conditional_get(post_service.get_post_version, "post:{post_id}")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("post:{post_id}"),
+)
 async def get_post_by_id(
     session: db_session,
     post_id: UUID,
@@ -75,33 +138,63 @@ async def get_posts_by_ids(
         PostSchema,
         refresh=False,
         post_ids=post_ids,
+        projection=PostSchema,
     )
 
 
-@post_router.get("/paginated")
-async def get_posts_with_pagination(
+@post_router.post("/")
+async def create_post(
     session: db_session,
-    params: Annotated[Params, Depends()],
-) -> list[PostSchema]:
+    post_data: Annotated[PostCreate, Depends()],
+) -> PostSchema:
     return await run_crud_action(
         session,
-        post_service.get_posts_with_paginated,
+        post_service.create_post,
         PostSchema,
+        post_data=post_data,
+    )
+
+
+@post_router.post("/bulk")
+async def create_posts_bulk(
+    session: db_session,
+    posts_data: list[PostCreate],
+) -> BulkCreateSchema[PostSchema]:
+    return await run_crud_action(
+        session,
+        post_service.create_many_posts,
+        BulkCreateSchema[PostSchema],
         refresh=False,
-        params=params,
+        begin=False,
+        posts_data=posts_data,
     )
 
 
-@post_router.post("/")
-async def create_post(
+@post_router.patch("/bulk")
+async def update_posts_bulk(
     session: db_session,
-    post_data: Annotated[PostCreate, Depends()],
-) -> PostSchema:
+    bulk_upd: BulkUpdateSchema[PostUpdatePartial],
+) -> BulkIdsSchema:
     return await run_crud_action(
         session,
-        post_service.create_post,
-        PostSchema,
-        post_data=post_data,
+        post_service.update_many_posts,
+        BulkIdsSchema,
+        refresh=False,
+        bulk_upd=bulk_upd,
+    )
+
+
+@post_router.delete("/bulk")
+async def delete_posts_bulk(
+    session: db_session,
+    post_ids: list[UUID],
+) -> BulkIdsSchema:
+    return await run_crud_action(
+        session,
+        post_service.delete_many_posts,
+        BulkIdsSchema,
+        refresh=False,
+        post_ids=post_ids,
     )
 
 
@@ -146,3 +239,5 @@ async def delete_post(
             session,
             post,
         )
+
+    await evict_pending_tags(session)
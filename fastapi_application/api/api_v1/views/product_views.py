@@ -2,19 +2,39 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, APIRouter
-from fastapi_cache.decorator import cache
 from fastapi_pagination import Params
 
 from fastapi_application.core.config import settings
+from fastapi_application.core.schemas.bulk_schema import (
+    BulkCreateSchema,
+    BulkUpdateSchema,
+    BulkIdsSchema,
+)
+from fastapi_application.core.schemas.pagination_schema import (
+    CursorPageSchema,
+    PageSchema,
+)
+from fastapi_application.core.repositories.utils import CountStrategy
 from fastapi_application.core.schemas.product_schema import (
     ProductSchema,
     ProductCreate,
     ProductUpdate,
     ProductUpdatePartial,
+    ProductUpsert,
 )
 from fastapi_application.core.services.product_service import ProductService
 from fastapi_application.api.api_v1.views.main_dependencies_for_views import db_session
 from fastapi_application.api.api_v1.views.utils import run_crud_action
+from fastapi_application.core.models import Product
+from fastapi_application.core.cache import (
+    cache,
+    conditional_get,
+    evict_pending_tags,
+    get_many_cached,
+    list_version,
+    tagged_key_builder,
+    versioned_key_builder,
+)
 
 from fastapi_application.core.repositories.category_repository import (
     SQLAlchemyCategoryRepository,
@@ -49,11 +69,31 @@ product_service = ProductService(
 
 
 @product_router.get("/")
+@conditional_get(
+    list_version(Product),
+    unless=("keyset", "cursor"),
+)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Product),
+)
 async def get_products(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
-) -> list[ProductSchema]:
+    keyset: bool = False,
+    cursor: str | None = None,
+) -> list[ProductSchema] | CursorPageSchema[ProductSchema]:
+    if keyset or cursor:
+        return await run_crud_action(
+            session,
+            product_service.get_products_by_cursor,
+            CursorPageSchema[ProductSchema],
+            refresh=False,
+            limit=limit,
+            cursor=cursor,
+        )
+
     return await run_crud_action(
         session,
         product_service.get_all_products,
@@ -61,11 +101,36 @@ async def get_products(
         refresh=False,
         limit=limit,
         offset=offset,
+        projection=ProductSchema,
+    )
+
+
+@product_router.get("/paginated")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(Product),
+)
+async def get_products_with_pagination(
+    session: db_session,
+    params: Annotated[Params, Depends()],
+    count: CountStrategy | None = None,
+) -> PageSchema[ProductSchema]:
+    return await run_crud_action(
+        session,
+        product_service.get_products_with_paginated,
+        PageSchema[ProductSchema],
+        refresh=False,
+        params=params,
+        count_strategy=count,
     )
 
 
 @product_router.get("/{product_id}")
-@cache(expire=300)
+@conditional_get(product_service.get_product_version, "product:{product_id}")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("product:{product_id}", entity=True),
+)
 async def get_product_by_id(
     session: db_session,
     product_id: UUID,
@@ -84,39 +149,102 @@ async def get_products_by_ids(
     session: db_session,
     product_ids: list[UUID],
 ) -> list[ProductSchema]:
+    async def fetch(ids: list[UUID]) -> list[ProductSchema]:
+        return await run_crud_action(
+            session,
+            product_service.get_many_products,
+            ProductSchema,
+            refresh=False,
+            product_ids=ids,
+            projection=ProductSchema,
+        )
+
+    return await get_many_cached(product_ids, "product:{}", fetch)
+
+
+@product_router.post("/")
+async def create_product(
+    session: db_session,
+    product_data: Annotated[ProductCreate, Depends()],
+) -> ProductSchema:
     return await run_crud_action(
         session,
-        product_service.get_many_products,
+        product_service.create_product,
         ProductSchema,
+        product_data=product_data,
+    )
+
+
+@product_router.post("/bulk")
+async def create_products_bulk(
+    session: db_session,
+    products_data: list[ProductCreate],
+) -> BulkCreateSchema[ProductSchema]:
+    return await run_crud_action(
+        session,
+        product_service.create_many_products,
+        BulkCreateSchema[ProductSchema],
+        refresh=False,
+        begin=False,
+        products_data=products_data,
+    )
+
+
+@product_router.patch("/bulk")
+async def update_products_bulk(
+    session: db_session,
+    bulk_upd: BulkUpdateSchema[ProductUpdatePartial],
+) -> BulkIdsSchema:
+    return await run_crud_action(
+        session,
+        product_service.update_many_products,
+        BulkIdsSchema,
+        refresh=False,
+        bulk_upd=bulk_upd,
+    )
+
+
+@product_router.delete("/bulk")
+async def delete_products_bulk(
+    session: db_session,
+    product_ids: list[UUID],
+) -> BulkIdsSchema:
+    return await run_crud_action(
+        session,
+        product_service.delete_many_products,
+        BulkIdsSchema,
         refresh=False,
         product_ids=product_ids,
     )
 
 
-@product_router.get("/paginated")
-async def get_orders_with_pagination(
+@product_router.put("/bulk")
+async def upsert_products_bulk(
     session: db_session,
-    params: Annotated[Params, Depends()],
-) -> list[ProductSchema]:
+    products_data: list[ProductCreate],
+) -> BulkCreateSchema[ProductSchema]:
     return await run_crud_action(
         session,
-        product_service.get_products_with_paginated,
-        ProductSchema,
+        product_service.upsert_many_products,
+        BulkCreateSchema[ProductSchema],
         refresh=False,
-        params=params,
+        products_data=products_data,
     )
 
 
-@product_router.post("/")
-async def create_product(
+@product_router.put("/by_name/{product_name}")
+async def upsert_product_by_name(
     session: db_session,
-    product_data: Annotated[ProductCreate, Depends()],
+    product_name: str,
+    product_upd: ProductUpsert,
 ) -> ProductSchema:
     return await run_crud_action(
         session,
-        product_service.create_product,
+        product_service.upsert_product,
         ProductSchema,
-        product_data=product_data,
+        refresh=False,
+        product_name=product_name,
+        product_upd=product_upd,
     )
 
 
@@ -161,3 +289,5 @@ async def delete_order(
             await product_service.delete_product(session, product)
     else:
         await product_service.delete_product(session, product)
+
+    await evict_pending_tags(session)
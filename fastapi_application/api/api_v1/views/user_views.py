@@ -1,11 +1,16 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, APIRouter
-from fastapi_cache.decorator import cache
+from fastapi import Depends, APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import Params
 
 from fastapi_application.core.config import settings
+from fastapi_application.core.schemas.pagination_schema import (
+    CursorPageSchema,
+    PageSchema,
+)
+from fastapi_application.core.repositories.utils import CountStrategy
 from fastapi_application.core.schemas.user_schema import UserUpdate, UserUpdatePartial
 from fastapi_application.core.schemas.user_schema import (
     UserSchema,
@@ -17,6 +22,16 @@ from fastapi_application.core.schemas.user_schema import (
 from fastapi_application.core.services.user_service import UserService
 from fastapi_application.api.api_v1.views.main_dependencies_for_views import db_session
 from fastapi_application.api.api_v1.views.utils import run_crud_action
+from fastapi_application.core.models import User
+from fastapi_application.core.cache import (
+    cache,
+    conditional_get,
+    evict_pending_tags,
+    get_many_cached,
+    list_version,
+    tagged_key_builder,
+    versioned_key_builder,
+)
 from fastapi_application.core.repositories import obj_by_id_factory
 from fastapi_application.core.repositories import (
     SQLAlchemyUserRepository,
@@ -41,11 +56,31 @@ user_service = UserService(
 
 
 @user_router.get("/")
+@conditional_get(
+    list_version(User),
+    unless=("keyset", "cursor"),
+)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=versioned_key_builder(User),
+)
 async def get_users(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
-) -> list[UserSchema]:
+    keyset: bool = False,
+    cursor: str | None = None,
+) -> list[UserSchema] | CursorPageSchema[UserSchema]:
+    if keyset or cursor:
+        return await run_crud_action(
+            session,
+            user_service.get_users_by_cursor,
+            CursorPageSchema[UserSchema],
+            refresh=False,
+            limit=limit,
+            cursor=cursor,
+        )
+
     return await run_crud_action(
         session,
         user_service.get_all_users,
@@ -53,11 +88,16 @@ async def get_users(
         refresh=False,
         limit=limit,
         offset=offset,
+        projection=UserSchema,
     )
 
 
 @user_router.get("/{user_id}")
-@cache(expire=300)
+@conditional_get(user_service.get_user_version, "user:{user_id}")
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("user:{user_id}", entity=True),
+)
 async def get_user_by_id(
     session: db_session,
     user_id: UUID,
@@ -76,17 +116,24 @@ async def get_users_by_ids(
     session: db_session,
     user_ids: list[UUID],
 ) -> list[UserSchema]:
-    return await run_crud_action(
-        session,
-        user_service.get_many_users,
-        UserSchema,
-        refresh=False,
-        user_ids=user_ids,
-    )
+    async def fetch(ids: list[UUID]) -> list[UserSchema]:
+        return await run_crud_action(
+            session,
+            user_service.get_many_users,
+            UserSchema,
+            refresh=False,
+            user_ids=ids,
+            projection=UserSchema,
+        )
+
+    return await get_many_cached(user_ids, "user:{}", fetch)
 
 
 @user_router.get("/user/{username}")
-@cache(expire=300)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("user:username:{username}"),
+)
 async def get_user_by_username(
     session: db_session,
     username: str,
@@ -101,7 +148,10 @@ async def get_user_by_username(
 
 
 @user_router.get("/user/mail/{email}")
-@cache(expire=300)
+@cache(
+    expire=settings.cache.ttl,
+    key_builder=tagged_key_builder("user:email:{email}"),
+)
 async def get_user_by_email(
     session: db_session,
     email: str,
@@ -115,11 +165,26 @@ async def get_user_by_email(
     )
 
 
-@user_router.post("/many/with_orders")
+@user_router.post(
+    "/many/with_orders",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[UserSchemaWithOrders]}},
+)
 async def get_many_users_with_orders(
     session: db_session,
     user_ids: list[UUID],
-) -> list[UserSchemaWithOrders]:
+    json_agg: bool = False,
+) -> Response | list[UserSchemaWithOrders]:
+    if json_agg:
+        document = await run_crud_action(
+            session,
+            user_service.get_many_users_with_orders_json,
+            refresh=False,
+            user_ids=user_ids,
+        )
+        return Response(content=document, media_type="application/json")
+
     return await run_crud_action(
         session,
         user_service.get_many_users_with_orders,
@@ -143,12 +208,28 @@ async def get_many_users_with_posts(
     )
 
 
-@user_router.post("/with_orders")
+@user_router.post(
+    "/with_orders",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[UserSchemaWithOrders]}},
+)
 async def get_users_with_orders(
     session: db_session,
     limit: int = 50,
     offset: int = 0,
-) -> list[UserSchemaWithOrders]:
+    json_agg: bool = False,
+) -> Response | list[UserSchemaWithOrders]:
+    if json_agg:
+        document = await run_crud_action(
+            session,
+            user_service.get_users_with_orders_json,
+            refresh=False,
+            limit=limit,
+            offset=offset,
+        )
+        return Response(content=document, media_type="application/json")
+
     return await run_crud_action(
         session,
         user_service.get_users_with_orders,
@@ -179,13 +260,15 @@ async def get_users_with_posts(
 async def get_users_with_pagination(
     session: db_session,
     params: Annotated[Params, Depends()],
-) -> list[UserSchema]:
+    count: CountStrategy | None = None,
+) -> PageSchema[UserSchema]:
     return await run_crud_action(
         session,
         user_service.get_users_with_paginated,
-        UserSchema,
+        PageSchema[UserSchema],
         refresh=False,
         params=params,
+        count_strategy=count,
     )
 
 
@@ -243,3 +326,5 @@ async def delete_user(
             await user_service.delete_user(session, user)
     else:
         await user_service.delete_user(session, user)
+
+    await evict_pending_tags(session)
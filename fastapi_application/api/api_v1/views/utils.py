@@ -1,8 +1,19 @@
 from typing import Callable, Awaitable, Any, Type
 
 from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_application.core.cache import evict_pending_tags
+
+
+def _to_schema(schema: Type[BaseModel], obj: Any) -> BaseModel:
+    if isinstance(obj, Row):
+        # projected rows hold exactly the schema's columns, already typed by
+        # the driver: FastAPI validates the response once, so skip it here
+        return schema.model_construct(**obj._mapping)
+    return schema.model_validate(obj)
+
 
 async def run_crud_action(
     session: AsyncSession,
@@ -10,19 +21,26 @@ async def run_crud_action(
     schema: Type[BaseModel] | None = None,
     refresh: bool = True,
     *args,
+    begin: bool = True,
     **kwargs,
 ) -> Any:
-    if not session.in_transaction():
+    if not begin:
+        # func runs its own transactions (bulk creates); commit what's left open
+        result = await func(session, *args, **kwargs)
+        if session.in_transaction():
+            await session.commit()
+    elif not session.in_transaction():
         async with session.begin():
             result = await func(session, *args, **kwargs)
     else:
         result = await func(session, *args, **kwargs)
+    await evict_pending_tags(session)
 
     if refresh and not isinstance(result, list):
         await session.refresh(result)
 
     if schema:
         if isinstance(result, list):
-            return [schema.model_validate(obj) for obj in result]
+            return [_to_schema(schema, obj) for obj in result]
         return schema.model_validate(result)
     return result
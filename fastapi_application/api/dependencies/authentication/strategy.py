@@ -9,6 +9,7 @@ from fastapi_users.authentication.strategy.db import (
 )
 
 from fastapi_application.api.dependencies.authentication.get_dbs import get_access_token_db
+from fastapi_application.core.authentication.strategy import CachedDatabaseStrategy
 from fastapi_application.core.config import settings
 from fastapi_application.core.models.access_token import AccessToken
 
@@ -23,7 +24,12 @@ def get_database_strategy(
         Depends(get_access_token_db),
     ],
 ) -> DatabaseStrategy:
-    return DatabaseStrategy(
+    strategy_class = (
+        CachedDatabaseStrategy
+        if settings.access_token.cache_enabled
+        else DatabaseStrategy
+    )
+    return strategy_class(
         database=access_tokens_db,
         lifetime_seconds=settings.access_token.lifetime_seconds,
     )
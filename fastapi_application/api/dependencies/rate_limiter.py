@@ -0,0 +1,268 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from ipaddress import ip_address
+
+import structlog
+from fastapi_limiter import FastAPILimiter
+from fastapi_limiter.depends import RateLimiter
+from redis.exceptions import ConnectionError, TimeoutError
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_application.core.cache import get_cached_token_user
+from fastapi_application.core.config import RateLimiterMode, RouteCost, settings
+
+logger = structlog.get_logger(__name__)
+
+# first fragment found in the route path decides the default cost class
+ROUTE_CLASS_RULES = (
+    ("with_orders", "nested"),
+    ("with_posts", "nested"),
+    ("with_products", "nested"),
+    ("/bulk", "bulk"),
+    ("/many", "many"),
+    ("/paginated", "list"),
+)
+
+# spend ARGV[1] of ARGV[2] tokens in window key KEYS[1]; PTTL if over budget
+SPEND_SCRIPT = """
+local used = redis.call("INCRBY", KEYS[1], ARGV[1])
+if used == tonumber(ARGV[1]) then
+    redis.call("PEXPIRE", KEYS[1], ARGV[3])
+end
+if used > tonumber(ARGV[2]) then
+    redis.call("DECRBY", KEYS[1], ARGV[1])
+    return math.max(redis.call("PTTL", KEYS[1]), 1)
+end
+return 0
+"""
+
+
+@dataclass
+class _Window:
+    # epoch ms the window closes at: first hit + seconds, then Redis's PTTL
+    resets_at: float
+    # total consumed by all workers, as of the last sync
+    synced: int = 0
+    # consumed here and not yet added to Redis
+    pending: int = 0
+
+
+class FailOpenRateLimiter(RateLimiter):
+    """fastapi-limiter's RateLimiter that lets requests through without Redis."""
+
+    async def _check(self, key: str) -> int:
+        try:
+            return await super()._check(key)
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Rate limiter unavailable, request allowed", error=str(e))
+            return 0
+
+
+class HybridRateLimiter(RateLimiter):
+    """RateLimiter that counts locally and reconciles with Redis in batches.
+
+    Keeps fastapi-limiter's identifier, key and `times` per `seconds` budget,
+    including its window that opens at the key's first hit. Requests are
+    admitted from the local view of the window; every `sync_interval` seconds
+    pending counts are added to the shared Redis key in one MULTI (SET NX PX
+    opens the window, INCRBY, PTTL), which also brings back the other workers'
+    usage and the window's end.
+    A worker never holds more than `times * sync_margin` unsynced requests per
+    key (it syncs inline first), so the limit is overshot by at most that much
+    per other worker. If Redis is unreachable each worker keeps limiting alone.
+    """
+
+    def __init__(
+        self,
+        times: int,
+        seconds: int,
+        sync_interval: float,
+        sync_margin: float,
+        **kwargs,
+    ) -> None:
+        super().__init__(times=times, seconds=seconds, **kwargs)
+        self.sync_interval = sync_interval
+        self.max_unsynced = max(1, math.floor(times * sync_margin))
+        self._windows: dict[str, _Window] = {}
+        self._lock = asyncio.Lock()
+        self._sync_task: asyncio.Task | None = None
+
+    async def _check(self, key: str) -> int:
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._run_sync())
+
+        now = time.time() * 1000
+        state = self._windows.get(key)
+        if state is None or state.resets_at <= now:
+            state = self._windows[key] = _Window(now + self.milliseconds)
+        if state.pending >= self.max_unsynced:
+            await self.sync()
+
+        if state.synced + state.pending >= self.times:
+            return max(math.ceil(state.resets_at - now), 1)
+        state.pending += 1
+        return 0
+
+    async def sync(self) -> None:
+        async with self._lock:
+            now = time.time() * 1000
+            # unsynced counts of a closed window are dropped with it
+            self._windows = {
+                key: state
+                for key, state in self._windows.items()
+                if state.resets_at > now
+            }
+            states = list(self._windows.items())
+            if not states:
+                return
+
+            flushed = [state.pending for _, state in states]
+            for _, state in states:
+                state.pending = 0
+            try:
+                async with FastAPILimiter.redis.pipeline(transaction=True) as pipe:
+                    for (key, _), count in zip(states, flushed):
+                        pipe.set(key, 0, px=self.milliseconds, nx=True)
+                        pipe.incrby(key, count)
+                        pipe.pttl(key)
+                    results = await pipe.execute()
+            except Exception as e:
+                for (_, state), count in zip(states, flushed):
+                    state.pending += count
+                logger.warning("Failed to sync rate limits", error=str(e))
+                return
+
+            now = time.time() * 1000
+            for (_, state), total, pttl in zip(states, results[1::3], results[2::3]):
+                state.synced = int(total)
+                if pttl > 0:
+                    state.resets_at = now + pttl
+
+    async def _run_sync(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            await self.sync()
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in settings.rate_limiter.trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
+    """The peer address, or behind trusted proxies the right-most untrusted hop.
+
+    Hops a client writes into X-Forwarded-For itself sit left of the ones
+    our proxies append, so only those are read, right to left.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(host):
+        return host
+    forwarded = request.headers.get("X-Forwarded-For", "")
+    for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        host = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return host
+
+
+async def principal_identifier(request: Request) -> str:
+    """The authenticated user behind the bearer token, else the client IP.
+
+    The token's owner comes from the Redis token cache that authentication
+    fills, never from the database, so made-up tokens cost one Redis read and
+    land on the IP, as does a valid token before its first authenticated use.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        user = await get_cached_token_user(token)
+        if user is not None:
+            return f"user:{user.id}"
+    return f"ip:{client_ip(request)}"
+
+
+def route_cost_class(request: Request) -> str:
+    route = request.scope.get("route")
+    path = route.path if route is not None else request.url.path
+    override = settings.rate_limiter.route_classes.get(f"{request.method} {path}")
+    if override is not None:
+        return override
+    for fragment, cost_class in ROUTE_CLASS_RULES:
+        if fragment in path:
+            return cost_class
+    if request.method == "GET" and path.endswith("/"):
+        return "list"
+    return "default"
+
+
+class WeightedRateLimiter(RateLimiter):
+    """Per-principal token budgets, spent according to the route's cost class.
+
+    Each principal (user, else IP) gets `budgets[group]` tokens per `seconds`
+    for every route group, so heavy bulk and nested routes drain their own
+    budget rather than the one cheap routes use. A request costs its class's
+    tokens; over budget it gets 429 and the tokens are not spent. Allows
+    requests while Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        seconds: int,
+        budgets: dict[str, int],
+        cost_classes: dict[str, RouteCost],
+    ) -> None:
+        super().__init__(times=0, seconds=seconds, identifier=principal_identifier)
+        self.budgets = budgets
+        self.cost_classes = cost_classes
+        self._spend = None
+
+    async def __call__(self, request: Request, response: Response):
+        route_cost = self.cost_classes.get(
+            route_cost_class(request), self.cost_classes["default"]
+        )
+        principal = await principal_identifier(request)
+        window = int(time.time() * 1000 // self.milliseconds)
+        key = f"{FastAPILimiter.prefix}:{principal}:{route_cost.group}:{window}"
+
+        if self._spend is None:
+            self._spend = FastAPILimiter.redis.register_script(SPEND_SCRIPT)
+        try:
+            pexpire = await self._spend(
+                keys=[key],
+                args=[
+                    route_cost.cost,
+                    self.budgets.get(route_cost.group, self.budgets["default"]),
+                    self.milliseconds,
+                ],
+            )
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning("Rate limiter unavailable, request allowed", error=str(e))
+            return
+        if pexpire != 0:
+            return await FastAPILimiter.http_callback(request, response, pexpire)
+
+
+def create_rate_limiter() -> RateLimiter:
+    if settings.rate_limiter.mode == RateLimiterMode.WEIGHTED:
+        return WeightedRateLimiter(
+            seconds=settings.rate_limiter.seconds,
+            budgets=settings.rate_limiter.budgets,
+            cost_classes=settings.rate_limiter.cost_classes,
+        )
+    if settings.rate_limiter.mode == RateLimiterMode.HYBRID:
+        return HybridRateLimiter(
+            times=settings.rate_limiter.times,
+            seconds=settings.rate_limiter.seconds,
+            sync_interval=settings.rate_limiter.sync_interval,
+            sync_margin=settings.rate_limiter.sync_margin,
+        )
+    return FailOpenRateLimiter(
+        times=settings.rate_limiter.times,
+        seconds=settings.rate_limiter.seconds,
+    )
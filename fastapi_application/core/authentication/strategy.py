@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi_users import exceptions
+from fastapi_users.authentication.strategy.db import DatabaseStrategy
+from fastapi_users.manager import BaseUserManager
+
+from fastapi_application.core.cache import (
+    cache_token_user,
+    get_cached_token_user,
+    revoke_token,
+    token_epoch,
+)
+from fastapi_application.core.models import User
+
+
+class CachedDatabaseStrategy(DatabaseStrategy):
+    """DatabaseStrategy with the token's user cached in Redis.
+
+    A cached token authenticates without touching Postgres: its user (minus
+    the password hash) is kept under the token's hash until the token expires.
+    Logout drops the entry before the token row, and fails if Redis can't be
+    reached, so a revoked token can't come back from the cache; user updates
+    and deletes drop all of the user's entries. The cached user is detached
+    and has no password hash: UserManager reloads it before writing.
+    """
+
+    async def read_token(
+        self, token: Optional[str], user_manager: BaseUserManager
+    ) -> Optional[User]:
+        if token is None:
+            return None
+        user = await get_cached_token_user(token)
+        if user is not None:
+            return user
+
+        now = datetime.now(timezone.utc)
+        max_age = None
+        if self.lifetime_seconds:
+            max_age = now - timedelta(seconds=self.lifetime_seconds)
+        access_token = await self.database.get_by_token(token, max_age)
+        if access_token is None:
+            return None
+        epoch = await token_epoch(access_token.user_id)
+        try:
+            user = await user_manager.get(user_manager.parse_id(access_token.user_id))
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+        if epoch is not None and self.lifetime_seconds:
+            expires_at = access_token.created_at + timedelta(
+                seconds=self.lifetime_seconds
+            )
+            ttl = int((expires_at - now).total_seconds())
+            await cache_token_user(token, user, ttl, epoch)
+        return user
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        await revoke_token(token)
+        await super().destroy_token(token, user)
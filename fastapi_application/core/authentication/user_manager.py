@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 import structlog
 from fastapi_users import (
@@ -7,12 +7,15 @@ from fastapi_users import (
     UUIDIDMixin,
 )
 from fastapi_users.db import BaseUserDatabase
+from sqlalchemy import inspect as sa_inspect
 
+from fastapi_application.core.cache import forget_missing_now, revoke_user_tokens_now
 from fastapi_application.core.config import settings
 from fastapi_application.core.models import User
 
 if TYPE_CHECKING:
     from fastapi import Request, BackgroundTasks
+    from fastapi_users import schemas
     from fastapi_users.password import PasswordHelperProtocol
 
 logger = structlog.get_logger()
@@ -31,6 +34,44 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         super().__init__(user_db, password_helper)
         self.background_tasks = background_tasks
 
+    async def _reload(self, user: User) -> User:
+        # users served from the token cache are detached and carry no password
+        # hash: write paths work on the database row instead
+        if sa_inspect(user).detached:
+            return await self.get(user.id)
+        return user
+
+    async def update(
+        self,
+        user_update: "schemas.BaseUserUpdate",
+        user: User,
+        safe: bool = False,
+        request: Optional["Request"] = None,
+    ) -> User:
+        user = await self._reload(user)
+        return await super().update(user_update, user, safe, request)
+
+    async def delete(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ) -> None:
+        await super().delete(await self._reload(user), request)
+
+    async def request_verify(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ) -> None:
+        await super().request_verify(await self._reload(user), request)
+
+    async def forgot_password(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ) -> None:
+        await super().forgot_password(await self._reload(user), request)
+
     async def on_after_register(
         self,
         user: User,
@@ -40,8 +81,26 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             "User %r has registered.",
             user.id,
         )
+        await forget_missing_now(User, "username", user.username)
+        await forget_missing_now(User, "email", user.email)
         # await send_new_user_notification(user)
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional["Request"] = None,
+    ):
+        # cached tokens carry the old user, e.g. still active
+        await revoke_user_tokens_now(user.id)
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ):
+        await revoke_user_tokens_now(user.id)
+
     async def on_after_forgot_password(
         self,
         user: User,
@@ -83,6 +142,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             "User %r has been verified",
             user.id,
         )
+        await revoke_user_tokens_now(user.id)
 
         # self.background_tasks.add_task(
         #     send_email_confirmed,
@@ -0,0 +1,60 @@
+__all__ = (
+    "TaggedRedisBackend",
+    "tagged_key_builder",
+    "invalidate_tags",
+    "evict_pending_tags",
+    "evict_tags",
+    "invalidate_lists",
+    "list_version",
+    "versioned_key_builder",
+    "is_known_missing",
+    "remember_missing",
+    "forget_missing",
+    "forget_missing_now",
+    "LocalCache",
+    "TwoTierBackend",
+    "create_cache_backend",
+    "conditional_get",
+    "weak_etag",
+    "ResponseBytesCoder",
+    "cache",
+    "get_many_cached",
+    "store_entities",
+    "cache_route",
+    "token_epoch",
+    "get_cached_token_user",
+    "cache_token_user",
+    "revoke_token",
+    "revoke_user_tokens",
+    "revoke_user_tokens_now",
+)
+
+
+from .metrics import cache_route
+from .backend import TaggedRedisBackend
+from .tags import (
+    tagged_key_builder,
+    invalidate_tags,
+    evict_pending_tags,
+    evict_tags,
+)
+from .versions import invalidate_lists, list_version, versioned_key_builder
+from .negative import (
+    is_known_missing,
+    remember_missing,
+    forget_missing,
+    forget_missing_now,
+)
+from .local import LocalCache, TwoTierBackend, create_cache_backend
+from .etag import conditional_get, weak_etag
+from .coder import ResponseBytesCoder
+from .decorator import cache
+from .multi_get import get_many_cached, store_entities
+from .tokens import (
+    token_epoch,
+    get_cached_token_user,
+    cache_token_user,
+    revoke_token,
+    revoke_user_tokens,
+    revoke_user_tokens_now,
+)
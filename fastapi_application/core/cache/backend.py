@@ -0,0 +1,195 @@
+import asyncio
+import math
+import random
+import secrets
+import time
+from contextvars import ContextVar
+
+import structlog
+from fastapi_cache.backends.redis import RedisBackend
+
+from fastapi_application.core.cache.metrics import record_lookup, record_write, timed
+from fastapi_application.core.cache.tags import built_key_tags, tag_key
+from fastapi_application.core.config import settings
+
+VALUE_FIELD = "value"
+EXPIRES_FIELD = "expires_at"
+DELTA_FIELD = "delta"
+
+logger = structlog.get_logger(__name__)
+
+# (cache key, monotonic start, lock token) of the recomputation this request
+# runs; the time until set() is the recompute cost used for early refresh. The
+# token is None when the request computes without holding the lock.
+_recompute: ContextVar[tuple[str, float, str | None] | None] = ContextVar(
+    "cache_recompute", default=None
+)
+
+# delete lock KEYS[1] only while it still holds our token ARGV[1]
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+def lock_key(key: str) -> str:
+    return f"{key}:lock"
+
+
+class TaggedRedisBackend(RedisBackend):
+    """Redis backend with tag bookkeeping and stampede protection.
+
+    Entries are hashes holding the value, its logical expiry and the time it
+    took to compute. They outlive the logical expiry by CACHE__STALE_TTL so
+    that, while one request holding the per-key lock recomputes, the rest are
+    served the stale value. Hot entries are refreshed early with probability
+    growing towards expiry (XFetch), and expiries are jittered so keys cached
+    together don't expire together. The lock holds a per-request token and is
+    only released by its owner: by set(), or by release_recompute() when the
+    endpoint fails.
+    """
+
+    async def get_with_ttl(self, key: str) -> tuple[int, str | bytes | None]:
+        with timed("get"):
+            result, ttl, value = await self._lookup(key)
+        record_lookup(result, len(value) if value is not None else 0)
+        return ttl, value
+
+    async def _lookup(self, key: str) -> tuple[str, int, str | bytes | None]:
+        """(outcome, ttl, value) of a read; the outcome labels the metrics."""
+        value, expires_at, delta = await self.redis.hmget(
+            key, VALUE_FIELD, EXPIRES_FIELD, DELTA_FIELD
+        )
+        if value is None:
+            value = await self._wait_for_value(key)
+            return "miss" if value is None else "hit", 0, value
+
+        now = time.time()
+        remaining = float(expires_at) - now
+        early = float(delta) * settings.cache.early_refresh_beta * -math.log(
+            1.0 - random.random()
+        )
+        if remaining - early > 0:
+            return "hit", int(remaining), value
+
+        if await self._acquire_recompute(key):
+            return "miss", 0, None
+        if remaining > 0:
+            return "hit", int(remaining), value
+        return "stale", 0, value
+
+    async def get(self, key: str) -> str | bytes | None:
+        return await self.redis.hget(key, VALUE_FIELD)
+
+    async def get_many(self, keys: list[str]) -> list[tuple[int, bytes | None]]:
+        """Fresh values for keys in one round trip; stale entries count as misses."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hmget(key, VALUE_FIELD, EXPIRES_FIELD)
+            rows = await pipe.execute()
+
+        now = time.time()
+        result = []
+        for value, expires_at in rows:
+            remaining = float(expires_at) - now if value is not None else 0
+            result.append((int(remaining), value) if remaining > 0 else (0, None))
+        return result
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        recompute = _recompute.get()
+        delta = 0.0
+        token = None
+        if recompute is not None and recompute[0] == key:
+            delta = time.monotonic() - recompute[1]
+            token = recompute[2]
+            _recompute.set(None)
+
+        with timed("set"):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                self._queue_set(pipe, key, value, expire, built_key_tags(key), delta)
+                if token is not None:
+                    pipe.eval(RELEASE_LOCK_SCRIPT, 1, lock_key(key), token)
+                await pipe.execute()
+        record_write(len(value))
+
+    async def set_many(
+        self,
+        entries: list[tuple[str, bytes, tuple[str, ...]]],
+        expire: int | None = None,
+    ) -> None:
+        """Store (key, value, tags) entries in one transaction."""
+        with timed("set_many"):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for key, value, tags in entries:
+                    self._queue_set(pipe, key, value, expire, tags)
+                await pipe.execute()
+        record_write(sum(len(value) for _, value, _ in entries))
+
+    @staticmethod
+    def _queue_set(
+        pipe,
+        key: str,
+        value: bytes,
+        expire: int | None,
+        tags: tuple[str, ...],
+        delta: float = 0.0,
+    ) -> None:
+        expire = expire or settings.cache.ttl
+        jitter = settings.cache.ttl_jitter
+        logical_ttl = expire * random.uniform(1 - jitter, 1 + jitter)
+        physical_ttl = math.ceil(logical_ttl) + settings.cache.stale_ttl
+
+        pipe.delete(key)
+        pipe.hset(
+            key,
+            mapping={
+                VALUE_FIELD: value,
+                EXPIRES_FIELD: time.time() + logical_ttl,
+                DELTA_FIELD: delta,
+            },
+        )
+        pipe.expire(key, physical_ttl)
+        for tag in tags:
+            pipe.sadd(tag_key(tag), key)
+            pipe.expire(tag_key(tag), physical_ttl)
+
+    async def release_recompute(self) -> None:
+        """Give up a recomputation that ended without set(), e.g. on a 404."""
+        recompute = _recompute.get()
+        if recompute is None:
+            return
+        _recompute.set(None)
+        key, _, token = recompute
+        if token is None:
+            return
+        try:
+            await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key(key), token)
+        except Exception as e:
+            # the lock still expires after CACHE__LOCK_TTL
+            logger.warning("Failed to release recompute lock", key=key, error=str(e))
+
+    async def _acquire_recompute(self, key: str) -> bool:
+        token = secrets.token_hex(16)
+        acquired = await self.redis.set(
+            lock_key(key), token, nx=True, ex=settings.cache.lock_ttl
+        )
+        if acquired:
+            _recompute.set((key, time.monotonic(), token))
+        return bool(acquired)
+
+    async def _wait_for_value(self, key: str) -> str | bytes | None:
+        """On a cold miss let one request compute; the rest poll for its result."""
+        if await self._acquire_recompute(key):
+            return None
+
+        deadline = time.monotonic() + settings.cache.lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            value = await self.get(key)
+            if value is not None:
+                return value
+        # the lock holder is slow or gone: compute anyway, leaving its lock be
+        _recompute.set((key, time.monotonic(), None))
+        return None
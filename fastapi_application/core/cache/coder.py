@@ -0,0 +1,47 @@
+from typing import Any
+
+import orjson
+import zstandard
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder
+from starlette.responses import Response
+
+from fastapi_application.core.config import settings
+
+RAW = b"\x00"
+ZSTD = b"\x01"
+
+_compressor = zstandard.ZstdCompressor(level=settings.cache.compress_level)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+class ResponseBytesCoder(Coder):
+    """Stores the rendered JSON body, zstd-compressed above a size threshold.
+
+    Hits are decoded into a ready Response, so FastAPI sends the stored bytes
+    without validating or re-serializing the payload.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            body = value.body
+        else:
+            body = orjson.dumps(jsonable_encoder(value))
+        return cls.pack(body)
+
+    @classmethod
+    def pack(cls, body: bytes) -> bytes:
+        if len(body) < settings.cache.compress_min_bytes:
+            return RAW + body
+        return ZSTD + _compressor.compress(body)
+
+    @classmethod
+    def decode(cls, value: bytes) -> bytes:
+        if value[:1] == ZSTD:
+            return _decompressor.decompress(value[1:])
+        return value[1:]
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Response:
+        return Response(content=cls.decode(value), media_type="application/json")
@@ -0,0 +1,51 @@
+from functools import wraps
+from inspect import signature
+
+from fastapi_cache import FastAPICache, decorator
+from starlette.responses import Response
+
+from fastapi_application.core.cache.metrics import cache_route
+
+
+def cache(
+    expire: int | None = None,
+    key_builder=None,
+    namespace: str = "",
+):
+    """fastapi-cache's @cache that keeps its headers on raw-bytes hits.
+
+    ResponseBytesCoder turns hits into a Response, and FastAPI drops headers
+    set on the injected response when the endpoint returns its own. Backend
+    calls made inside are labelled with the endpoint name in cache metrics,
+    and a recompute lock taken for the call is released if the endpoint
+    raises instead of caching its result.
+    """
+
+    def wrapper(func):
+        cached = decorator.cache(
+            expire=expire,
+            key_builder=key_builder,
+            namespace=namespace,
+        )(func)
+        response_param = next(
+            param
+            for param in signature(cached).parameters.values()
+            if param.annotation is Response
+        )
+
+        @wraps(cached)
+        async def inner(*args, **kwargs):
+            response = kwargs.get(response_param.name)
+            with cache_route(func.__name__, namespace):
+                try:
+                    result = await cached(*args, **kwargs)
+                finally:
+                    await FastAPICache.get_backend().release_recompute()
+            if isinstance(result, Response) and response is not None:
+                if result is not response:
+                    result.raw_headers.extend(response.headers.raw)
+            return result
+
+        return inner
+
+    return wrapper
@@ -0,0 +1,146 @@
+import hashlib
+from functools import wraps
+from inspect import Parameter, signature
+from typing import Any, Awaitable, Callable
+
+import structlog
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from fastapi_application.core.cache.tags import tag_key
+from fastapi_application.core.config import settings
+from redis_conf.redis import AsyncRedisClient
+
+logger = structlog.get_logger(__name__)
+
+VersionGetter = Callable[..., Awaitable[str | None]]
+
+
+def weak_etag(version: str) -> str:
+    return f'W/"{hashlib.md5(version.encode()).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def resolve_etag(
+    version: VersionGetter,
+    tags: tuple[str, ...],
+    kwargs: dict[str, Any],
+    request: Request,
+) -> str | None:
+    """Build the ETag, reusing the one stored in Redis under the entity tags.
+
+    The stored ETag is registered in the same tag sets as the cached response,
+    so writes evict both and polling clients don't reach the database.
+    """
+    params = signature(version).parameters
+    version_kwargs = {name: kwargs[name] for name in params if name in kwargs}
+    for name, param in params.items():
+        if param.annotation is Request:
+            version_kwargs[name] = request
+    etag_key = None
+    client = None
+    if tags:
+        tag_values = [tag.format(**kwargs) for tag in tags]
+        etag_key = f"{settings.cache.prefix}:etag:{tag_values[0]}"
+        try:
+            client = await AsyncRedisClient.get_client()
+            stored = await AsyncRedisClient.get_tracked(etag_key)
+            if stored is not None:
+                return stored
+        except Exception as e:
+            logger.warning("Failed to read stored ETag", key=etag_key, error=str(e))
+            client = None
+
+    obj_version = await version(**version_kwargs)
+    if obj_version is None:
+        return None
+    etag = weak_etag(obj_version)
+
+    if client is not None:
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(etag_key, etag, ex=settings.cache.ttl)
+                for tag in tag_values:
+                    pipe.sadd(tag_key(tag), etag_key)
+                    pipe.expire(tag_key(tag), settings.cache.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to store ETag", key=etag_key, error=str(e))
+    return etag
+
+
+def _locate_param(params: list[Parameter], annotation: type, name: str):
+    for param in params:
+        if param.annotation is annotation:
+            return param, False
+    return Parameter(name, Parameter.KEYWORD_ONLY, annotation=annotation), True
+
+
+def conditional_get(
+    version: VersionGetter,
+    *tags: str,
+    unless: tuple[str, ...] = (),
+):
+    """Answer 304 Not Modified when If-None-Match matches the entity version.
+
+    version is called with the endpoint kwargs it accepts (session, ids,
+    limit/offset) and the request if it takes one, and returns a version
+    string, or None to skip the check; lists use list_version().
+    With tags the ETag is cached in Redis and evicted with them. unless names
+    parameters that turn the check off when set, e.g. keyset or cursor.
+    Goes above @cache so hits don't even reach the response cache.
+    """
+
+    def wrapper(func):
+        params = list(signature(func).parameters.values())
+        request_param, inject_request = _locate_param(params, Request, "etag_request")
+        response_param, inject_response = _locate_param(
+            params, Response, "etag_response"
+        )
+
+        @wraps(func)
+        async def inner(*args, **kwargs):
+            request: Request = kwargs[request_param.name]
+            response: Response = kwargs[response_param.name]
+            if inject_request:
+                kwargs.pop(request_param.name)
+            if inject_response:
+                kwargs.pop(response_param.name)
+
+            if request.method != "GET" or any(kwargs.get(name) for name in unless):
+                return await func(*args, **kwargs)
+
+            etag = await resolve_etag(version, tags, kwargs, request)
+            if etag is not None and etag_matches(request, etag):
+                return Response(
+                    status_code=HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+
+            result = await func(*args, **kwargs)
+            if etag is not None:
+                # cache hits come back as a ready Response
+                target = result if isinstance(result, Response) else response
+                target.headers["ETag"] = etag
+            return result
+
+        extra = [
+            param
+            for param, inject in (
+                (request_param, inject_request),
+                (response_param, inject_response),
+            )
+            if inject
+        ]
+        inner.__signature__ = signature(func).replace(parameters=[*params, *extra])
+        return inner
+
+    return wrapper
@@ -0,0 +1,10 @@
+import hashlib
+from typing import Any
+
+from starlette.requests import Request
+
+
+def request_digest(request: Request | None, args: tuple[Any, ...]) -> str:
+    """Digest of the request path and query; the injected session is left out."""
+    raw = f"{request.url.path}?{request.url.query}" if request else repr(args)
+    return hashlib.md5(raw.encode()).hexdigest()
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+import orjson
+import structlog
+
+from fastapi_application.core.cache.backend import TaggedRedisBackend
+from fastapi_application.core.cache.tags import INVALIDATION_CHANNEL
+from fastapi_application.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class LocalCache:
+    """Bounded in-process LRU with per-entry expiry and a byte budget."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        # key -> (local deadline, upstream deadline, value)
+        self._entries: OrderedDict[str, tuple[float, float, bytes | str]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[int, bytes | str] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        local_deadline, deadline, value = entry
+        now = time.monotonic()
+        if local_deadline <= now:
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return int(deadline - now), value
+
+    def set(self, key: str, value: bytes | str, ttl: float, local_ttl: float) -> None:
+        if ttl <= 0 or len(value) > self.max_bytes:
+            self.delete(key)
+            return
+        now = time.monotonic()
+        self.delete(key)
+        self._entries[key] = (now + min(ttl, local_ttl), now + ttl, value)
+        self.size += len(value)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[2])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class TwoTierBackend(TaggedRedisBackend):
+    """TaggedRedisBackend with a per-process LocalCache in front of it."""
+
+    def __init__(self, redis, local: LocalCache, local_ttl: int) -> None:
+        super().__init__(redis)
+        self.local = local
+        self.local_ttl = local_ttl
+
+    async def _lookup(self, key: str) -> tuple[str, int, bytes | str | None]:
+        hit = self.local.get(key)
+        if hit is not None:
+            return "local_hit", *hit
+
+        result, ttl, value = await super()._lookup(key)
+        if value is not None:
+            self.local.set(key, value, ttl, self.local_ttl)
+        return result, ttl, value
+
+    async def get(self, key: str) -> bytes | str | None:
+        hit = self.local.get(key)
+        if hit is not None:
+            return hit[1]
+        return await super().get(key)
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        await super().set(key, value, expire)
+        self.local.set(key, value, expire or self.local_ttl, self.local_ttl)
+
+    async def get_many(self, keys: list[str]) -> list[tuple[int, bytes | None]]:
+        result = [self.local.get(key) for key in keys]
+        missing = [i for i, hit in enumerate(result) if hit is None]
+        if missing:
+            fetched = await super().get_many([keys[i] for i in missing])
+            for i, (ttl, value) in zip(missing, fetched):
+                result[i] = ttl, value
+                if value is not None:
+                    self.local.set(keys[i], value, ttl, self.local_ttl)
+        return result
+
+    async def set_many(
+        self,
+        entries: list[tuple[str, bytes, tuple[str, ...]]],
+        expire: int | None = None,
+    ) -> None:
+        await super().set_many(entries, expire)
+        for key, value, _ in entries:
+            self.local.set(key, value, expire or self.local_ttl, self.local_ttl)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        self.local.clear()
+        return await super().clear(namespace, key)
+
+    async def listen_invalidations(self) -> None:
+        """Drop keys evicted by any worker; runs for the app's lifetime."""
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    for key in orjson.loads(message["data"]):
+                        self.local.delete(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # messages may have been missed while disconnected
+                self.local.clear()
+                logger.warning("Cache invalidation listener failed", error=str(e))
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+def create_cache_backend(redis) -> TaggedRedisBackend:
+    if not settings.cache.local_enabled:
+        return TaggedRedisBackend(redis)
+
+    local = LocalCache(
+        max_entries=settings.cache.local_max_entries,
+        max_bytes=settings.cache.local_max_bytes,
+    )
+    return TwoTierBackend(redis, local, settings.cache.local_ttl)
@@ -0,0 +1,85 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator
+
+from prometheus_client import Counter, Histogram
+
+LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups by outcome: hit, local_hit, stale or miss.",
+    ["route", "namespace", "result"],
+)
+BYTES = Counter(
+    "cache_bytes_total",
+    "Bytes of cached values read on hits and written on stores.",
+    ["route", "namespace", "op"],
+)
+LATENCY = Histogram(
+    "cache_operation_seconds",
+    "Latency of cache backend reads and writes.",
+    ["route", "namespace", "op"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+EVICTIONS = Counter(
+    "cache_evictions_total",
+    "Cache entries evicted by writes, by tag kind (e.g. product).",
+    ["kind"],
+)
+VERSION_BUMPS = Counter(
+    "cache_version_bumps_total",
+    "List cache versions bumped by writes, by table.",
+    ["table"],
+)
+
+# (route, namespace) of the cached endpoint running in this context
+_route: ContextVar[tuple[str, str]] = ContextVar(
+    "cache_route", default=("unknown", "default")
+)
+
+
+@contextmanager
+def cache_route(route: str, namespace: str = "") -> Iterator[None]:
+    token = _route.set((route, namespace or "default"))
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+def record_lookup(result: str, size: int = 0, count: int = 1) -> None:
+    route, namespace = _route.get()
+    LOOKUPS.labels(route, namespace, result).inc(count)
+    if size:
+        BYTES.labels(route, namespace, "read").inc(size)
+
+
+def record_write(size: int) -> None:
+    route, namespace = _route.get()
+    BYTES.labels(route, namespace, "write").inc(size)
+
+
+@contextmanager
+def timed(op: str) -> Iterator[None]:
+    route, namespace = _route.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        LATENCY.labels(route, namespace, op).observe(time.perf_counter() - start)
+
+
+def tag_kind(tag: str) -> str:
+    """"product:<id>" -> "product", keeping label cardinality bounded."""
+    return tag.split(":", 1)[0]
+
+
+def record_evictions(tags: Iterable[str], counts: Iterable[int]) -> None:
+    for tag, count in zip(tags, counts):
+        if count:
+            EVICTIONS.labels(tag_kind(tag)).inc(count)
+
+
+def record_version_bumps(tables: Iterable[str]) -> None:
+    for table in tables:
+        VERSION_BUMPS.labels(table).inc()
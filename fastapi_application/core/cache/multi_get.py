@@ -0,0 +1,92 @@
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+import orjson
+import structlog
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache import FastAPICache
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from fastapi_application.core.cache.coder import ResponseBytesCoder
+from fastapi_application.core.cache.metrics import (
+    cache_route,
+    record_lookup,
+    tag_kind,
+    timed,
+)
+from fastapi_application.core.cache.tags import ENTITY_PREFIX, entity_key
+from fastapi_application.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+async def store_entities(
+    rows: Iterable[BaseModel],
+    template: str,
+    *tags: str,
+) -> dict[Any, bytes]:
+    """Write rows to their single-entity cache entries; returns id -> JSON body."""
+    bodies = {}
+    entries = []
+    for row in rows:
+        body = orjson.dumps(jsonable_encoder(row))
+        bodies[row.id] = body
+        tag = template.format(row.id)
+        value = ResponseBytesCoder.pack(body)
+        entries.append((entity_key(tag), value, (tag, *tags)))
+    if not entries:
+        return bodies
+
+    try:
+        await FastAPICache.get_backend().set_many(entries, settings.cache.ttl)
+    except Exception as e:
+        logger.warning("Failed to write cache entries", error=str(e))
+    return bodies
+
+
+async def get_many_cached(
+    ids: Iterable[Hashable],
+    template: str,
+    fetch: Callable[[list[Any]], Awaitable[list[BaseModel]]],
+    *tags: str,
+) -> Response:
+    """Serve a /many request from the single-entity cache entries.
+
+    template names the entity, e.g. "product:{}", and must match the first tag
+    of the by-id route cached with tagged_key_builder(..., entity=True). Cached
+    ids are read in one round trip, fetch is called once with the misses only,
+    and the fetched rows are written back tagged with their entity tag and tags.
+    Rows are returned in request order; unknown ids are skipped.
+    """
+    ids = list(dict.fromkeys(ids))
+    keys = [entity_key(template.format(id_)) for id_ in ids]
+    backend = FastAPICache.get_backend()
+
+    with cache_route(f"{tag_kind(template)}_many", ENTITY_PREFIX):
+        try:
+            with timed("get_many"):
+                cached = await backend.get_many(keys)
+        except Exception as e:
+            logger.warning("Failed to read cache entries", error=str(e))
+            cached = [(0, None)] * len(keys)
+
+        bodies = {
+            id_: ResponseBytesCoder.decode(value)
+            for id_, (_, value) in zip(ids, cached)
+            if value is not None
+        }
+        missing = [id_ for id_ in ids if id_ not in bodies]
+        record_lookup(
+            "hit",
+            sum(len(value) for _, value in cached if value is not None),
+            count=len(ids) - len(missing),
+        )
+        record_lookup("miss", count=len(missing))
+
+        if missing:
+            rows = await fetch(missing)
+            bodies.update(await store_entities(rows, template, *tags))
+
+    logger.debug("Multi-get served", hits=len(ids) - len(missing), misses=len(missing))
+    content = b"[" + b",".join(bodies[id_] for id_ in ids if id_ in bodies) + b"]"
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,64 @@
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_application.core.config import settings
+from redis_conf.redis import AsyncRedisClient
+
+logger = structlog.get_logger(__name__)
+
+MISS_PREFIX = "cache-miss"
+PENDING_MISSES_KEY = "cache_misses"
+
+
+def miss_key(model: type, field: str, value: Any) -> str:
+    return f"{MISS_PREFIX}:{model.__table__.name}:{field}:{value}"
+
+
+async def is_known_missing(model: type, field: str, value: Any) -> bool:
+    try:
+        client = await AsyncRedisClient.get_client()
+        return bool(await client.exists(miss_key(model, field, value)))
+    except Exception as e:
+        logger.warning("Failed to read negative cache", error=str(e))
+        return False
+
+
+async def remember_missing(model: type, field: str, value: Any) -> None:
+    try:
+        client = await AsyncRedisClient.get_client()
+        await client.set(
+            miss_key(model, field, value), 1, ex=settings.cache.negative_ttl
+        )
+    except Exception as e:
+        logger.warning("Failed to write negative cache", error=str(e))
+
+
+def forget_missing(session: AsyncSession, model: type, field: str, *values: Any):
+    """Schedule negative entries for removal once the transaction commits."""
+    session.info.setdefault(PENDING_MISSES_KEY, set()).update(
+        miss_key(model, field, value) for value in values
+    )
+
+
+async def forget_missing_now(model: type, field: str, *values: Any) -> None:
+    keys = [miss_key(model, field, value) for value in values]
+    if not keys:
+        return
+    try:
+        client = await AsyncRedisClient.get_client()
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning("Failed to clear negative cache", error=str(e))
+
+
+async def forget_pending_misses(session: AsyncSession) -> None:
+    keys = session.info.pop(PENDING_MISSES_KEY, None)
+    if not keys:
+        return
+    try:
+        client = await AsyncRedisClient.get_client()
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning("Failed to clear negative cache", error=str(e))
@@ -0,0 +1,115 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable
+
+import orjson
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_application.core.cache.keys import request_digest
+from fastapi_application.core.cache.metrics import record_evictions
+from fastapi_application.core.cache.negative import forget_pending_misses
+from fastapi_application.core.cache.tokens import revoke_pending_tokens
+from fastapi_application.core.cache.versions import bump_pending_versions
+from fastapi_application.core.config import settings
+from redis_conf.redis import AsyncRedisClient
+
+logger = structlog.get_logger(__name__)
+
+TAG_PREFIX = "cache-tag"
+PENDING_TAGS_KEY = "cache_tags"
+INVALIDATION_CHANNEL = "cache-invalidate"
+ENTITY_PREFIX = "entity"
+
+# (cache key, tags) built for the current request; picked up by the backend
+# when it stores the response, so hits never pay for tag bookkeeping.
+_key_tags: ContextVar[tuple[str, tuple[str, ...]] | None] = ContextVar(
+    "cache_key_tags", default=None
+)
+
+
+def tag_key(tag: str) -> str:
+    return f"{TAG_PREFIX}:{tag}"
+
+
+def entity_key(tag: str) -> str:
+    """Key of the cached single-entity response for tag, e.g. "product:<id>"."""
+    return f"{settings.cache.prefix}:{ENTITY_PREFIX}:{tag}"
+
+
+def built_key_tags(key: str) -> tuple[str, ...]:
+    """Tags the key builder attached to key in the current request, if any."""
+    key_tags = _key_tags.get()
+    if key_tags is None or key_tags[0] != key:
+        return ()
+    return key_tags[1]
+
+
+def tagged_key_builder(*templates: str, entity: bool = False) -> Callable[..., str]:
+    """Key builder for @cache that tags the entry, e.g. "product:{product_id}".
+
+    Templates are formatted with the endpoint kwargs. The key itself is built
+    from the request path and query, so the injected session is not part of it.
+    With entity=True the key is entity_key() of the first tag instead, shared
+    with the multi-get of the /many endpoints.
+    """
+
+    def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Request | None = None,
+        response: Response | None = None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        tags = tuple(t.format(**kwargs) for t in templates)
+        if entity:
+            key = entity_key(tags[0])
+        else:
+            key = f"{namespace}:{func.__name__}:{request_digest(request, args)}"
+        _key_tags.set((key, tags))
+        return key
+
+    return key_builder
+
+
+async def evict_tags(tags: Iterable[str]) -> int:
+    tags = list(dict.fromkeys(tags))
+    tag_keys = [tag_key(tag) for tag in tags]
+    if not tag_keys:
+        return 0
+
+    client = await AsyncRedisClient.get_client()
+    async with client.pipeline(transaction=False) as pipe:
+        for key in tag_keys:
+            pipe.smembers(key)
+        members = await pipe.execute()
+
+    keys = {key for group in members for key in group}
+    evicted = await client.delete(*keys, *tag_keys)
+    record_evictions(tags, (len(group) for group in members))
+    if keys and settings.cache.local_enabled:
+        await client.publish(INVALIDATION_CHANNEL, orjson.dumps(sorted(keys)))
+    logger.debug("Cache tags evicted", tags=tag_keys, keys=len(keys))
+    return evicted
+
+
+def invalidate_tags(session: AsyncSession, *tags: str) -> None:
+    """Schedule tags for eviction once the session's transaction commits."""
+    session.info.setdefault(PENDING_TAGS_KEY, set()).update(tags)
+
+
+async def evict_pending_tags(session: AsyncSession) -> None:
+    """Apply the cache invalidations queued on the session by its writes."""
+    await bump_pending_versions(session)
+    await forget_pending_misses(session)
+    await revoke_pending_tokens(session)
+    tags = session.info.pop(PENDING_TAGS_KEY, None)
+    if not tags:
+        return
+    try:
+        await evict_tags(tags)
+    except Exception as e:
+        logger.warning("Failed to evict cache tags", tags=sorted(tags), error=str(e))
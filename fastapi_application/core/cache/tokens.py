@@ -0,0 +1,181 @@
+import hashlib
+import secrets
+from typing import Any
+from uuid import UUID
+
+import orjson
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from fastapi_application.core.models import User
+from redis_conf.redis import AsyncRedisClient
+
+logger = structlog.get_logger(__name__)
+
+TOKEN_PREFIX = "auth-token"
+USER_TOKENS_PREFIX = "auth-user"
+# token reads that straddle a revocation aren't cached: user changes replace
+# the user's epoch, logouts mark the token. Both only need to outlive reads in
+# flight; the epoch is random rather than a counter so it can expire.
+EPOCH_PREFIX = "auth-epoch"
+REVOKED_PREFIX = "auth-revoked"
+REVOCATION_TTL = 60
+PENDING_REVOCATIONS_KEY = "auth_revocations"
+# never cached: a Redis dump must not hand out password hashes
+UNCACHED_COLUMNS = frozenset({"hashed_password"})
+
+# cache KEYS[2] = ARGV[2] for ARGV[3] seconds under user index KEYS[3],
+# unless the user's epoch KEYS[1] changed from ARGV[1] since the read began
+# or the token was logged out (KEYS[4])
+STORE_SCRIPT = """
+if (redis.call("GET", KEYS[1]) or "0") ~= ARGV[1] then
+    return 0
+end
+if redis.call("EXISTS", KEYS[4]) == 1 then
+    return 0
+end
+redis.call("SET", KEYS[2], ARGV[2], "EX", ARGV[3])
+redis.call("SADD", KEYS[3], KEYS[2])
+if redis.call("TTL", KEYS[3]) < tonumber(ARGV[3]) then
+    redis.call("EXPIRE", KEYS[3], ARGV[3])
+end
+return 1
+"""
+
+# drop every cached token of the user index KEYS[2], setting the user's
+# epoch KEYS[1] to ARGV[1] for ARGV[2] seconds
+REVOKE_USER_SCRIPT = """
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2])
+local keys = redis.call("SMEMBERS", KEYS[2])
+for i = 1, #keys, 1000 do
+    redis.call("DEL", unpack(keys, i, math.min(i + 999, #keys)))
+end
+redis.call("DEL", KEYS[2])
+return #keys
+"""
+
+
+def _token_digest(token: str) -> str:
+    # hashed, so the cache doesn't hold usable bearer tokens
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_key(token: str) -> str:
+    return f"{TOKEN_PREFIX}:{_token_digest(token)}"
+
+
+def revoked_key(token: str) -> str:
+    return f"{REVOKED_PREFIX}:{_token_digest(token)}"
+
+
+def user_tokens_key(user_id: Any) -> str:
+    return f"{USER_TOKENS_PREFIX}:{user_id}"
+
+
+def epoch_key(user_id: Any) -> str:
+    return f"{EPOCH_PREFIX}:{user_id}"
+
+
+def _dump_user(user: User) -> bytes:
+    return orjson.dumps(
+        {
+            column.key: getattr(user, column.key)
+            for column in User.__table__.columns
+            if column.key not in UNCACHED_COLUMNS
+        }
+    )
+
+
+def _load_user(data: str) -> User:
+    values = orjson.loads(data)
+    for column in User.__table__.columns:
+        value = values.get(column.key)
+        if value is None or column.key in UNCACHED_COLUMNS:
+            continue
+        python_type = column.type.python_type
+        if python_type is UUID:
+            values[column.key] = UUID(value)
+        elif hasattr(python_type, "fromisoformat"):
+            values[column.key] = python_type.fromisoformat(value)
+    user = User(**values)
+    # a detached row, not a new one: merging it into a session won't INSERT
+    make_transient_to_detached(user)
+    return user
+
+
+async def token_epoch(user_id: Any) -> str | None:
+    """Read before loading the user; None (Redis down) disables caching."""
+    try:
+        client = await AsyncRedisClient.get_client()
+        return await client.get(epoch_key(user_id)) or "0"
+    except Exception as e:
+        logger.warning("Failed to read token cache epoch", error=str(e))
+        return None
+
+
+async def get_cached_token_user(token: str) -> User | None:
+    try:
+        client = await AsyncRedisClient.get_client()
+        data = await client.get(token_key(token))
+    except Exception as e:
+        logger.warning("Failed to read token cache", error=str(e))
+        return None
+    return _load_user(data) if data is not None else None
+
+
+async def cache_token_user(token: str, user: User, ttl: int, epoch: str) -> None:
+    if ttl <= 0:
+        return
+    try:
+        client = await AsyncRedisClient.get_client()
+        store = client.register_script(STORE_SCRIPT)
+        await store(
+            keys=[
+                epoch_key(user.id),
+                token_key(token),
+                user_tokens_key(user.id),
+                revoked_key(token),
+            ],
+            args=[epoch, _dump_user(user), ttl],
+        )
+    except Exception as e:
+        logger.warning("Failed to cache token", user_id=str(user.id), error=str(e))
+
+
+async def revoke_token(token: str) -> None:
+    """Drop one cached token. Raises if Redis can't be reached."""
+    client = await AsyncRedisClient.get_client()
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.set(revoked_key(token), 1, ex=REVOCATION_TTL)
+        pipe.delete(token_key(token))
+        await pipe.execute()
+
+
+async def revoke_user_tokens_now(*user_ids: Any) -> None:
+    try:
+        client = await AsyncRedisClient.get_client()
+        revoke = client.register_script(REVOKE_USER_SCRIPT)
+        for user_id in user_ids:
+            await revoke(
+                keys=[epoch_key(user_id), user_tokens_key(user_id)],
+                args=[secrets.token_hex(8), REVOCATION_TTL],
+            )
+    except Exception as e:
+        logger.warning(
+            "Failed to revoke cached tokens",
+            user_ids=[str(user_id) for user_id in user_ids],
+            error=str(e),
+        )
+
+
+def revoke_user_tokens(session: AsyncSession, *user_ids: Any) -> None:
+    """Schedule the users' cached tokens for removal once the transaction commits."""
+    session.info.setdefault(PENDING_REVOCATIONS_KEY, set()).update(user_ids)
+
+
+async def revoke_pending_tokens(session: AsyncSession) -> None:
+    user_ids = session.info.pop(PENDING_REVOCATIONS_KEY, None)
+    if not user_ids:
+        return
+    await revoke_user_tokens_now(*user_ids)
@@ -0,0 +1,121 @@
+from typing import Any, Awaitable, Callable
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_application.core.cache.keys import request_digest
+from fastapi_application.core.cache.metrics import record_version_bumps
+from redis_conf.redis import AsyncRedisClient
+
+logger = structlog.get_logger(__name__)
+
+VERSION_PREFIX = "cache-version"
+PENDING_VERSIONS_KEY = "cache_versions"
+
+
+def version_key(table: str) -> str:
+    return f"{VERSION_PREFIX}:{table}"
+
+
+def _mark_tables(session: Session, tables: set[str]) -> None:
+    if tables:
+        session.info.setdefault(PENDING_VERSIONS_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context: Any) -> None:
+    objs = (*session.new, *session.dirty, *session.deleted)
+    _mark_tables(session, {obj.__table__.name for obj in objs})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml_tables(orm_execute_state: ORMExecuteState) -> None:
+    # bulk insert/update/delete and upserts never reach the flush;
+    # track_versions=False: the caller bumps only if rows really changed
+    if not orm_execute_state.execution_options.get("track_versions", True):
+        return
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        table = orm_execute_state.statement.table
+        _mark_tables(orm_execute_state.session, {table.name})
+
+
+def invalidate_lists(session: AsyncSession, *models: type) -> None:
+    """Queue a version bump for writes the session events can't see (CTE DML)."""
+    _mark_tables(session.sync_session, {model.__table__.name for model in models})
+
+
+async def bump_pending_versions(session: AsyncSession) -> None:
+    tables = session.info.pop(PENDING_VERSIONS_KEY, None)
+    if not tables:
+        return
+    try:
+        client = await AsyncRedisClient.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for table in tables:
+                pipe.incr(version_key(table))
+            await pipe.execute()
+        record_version_bumps(tables)
+    except Exception as e:
+        logger.warning(
+            "Failed to bump cache versions", tables=sorted(tables), error=str(e)
+        )
+
+
+async def _table_versions(tables: list[str]) -> str | None:
+    try:
+        versions = await AsyncRedisClient.mget_tracked(
+            [version_key(table) for table in tables]
+        )
+    except Exception as e:
+        logger.warning("Failed to read cache versions", tables=tables, error=str(e))
+        return None
+    return ".".join(v or "0" for v in versions)
+
+
+def list_version(*models: type) -> Callable[..., Awaitable[str | None]]:
+    """Version getter for conditional_get on cached lists.
+
+    The models' table versions plus the request's path and query, so the
+    ETag changes exactly when versioned_key_builder's key does and is built
+    without a database query. None (Redis down) skips the check.
+    """
+    tables = [model.__table__.name for model in models]
+
+    async def version(request: Request) -> str | None:
+        versions = await _table_versions(tables)
+        if versions is None:
+            return None
+        return f"{versions}:{request_digest(request, ())}"
+
+    return version
+
+
+def versioned_key_builder(*models: type) -> Callable[..., Any]:
+    """Key builder for cached lists: keys embed the models' table versions.
+
+    Any committed write to those tables bumps its version, so every list
+    cached under the old one is abandoned at once and left to expire.
+    """
+    tables = [model.__table__.name for model in models]
+
+    async def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Request | None = None,
+        response: Response | None = None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        version = await _table_versions(tables) or "0"
+        return f"{namespace}:{func.__name__}:v{version}:{request_digest(request, args)}"
+
+    return key_builder
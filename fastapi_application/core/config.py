@@ -1,7 +1,8 @@
 import logging
+from enum import StrEnum
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, IPvAnyNetwork
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
@@ -61,17 +62,113 @@ class RedisConfig(BaseModel):
     host: str
     password: str
     port: str
+    max_connections: int = 20
+    # concurrent commands are coalesced into one pipeline per loop iteration,
+    # or per pipeline_window seconds when > 0
+    auto_pipeline: bool = True
+    pipeline_window: float = 0.0
+    pipeline_max_batch: int = 256
+    # short timeouts: a slow Redis should fail calls fast, not stall requests
+    socket_timeout: float = 0.5
+    connect_timeout: float = 0.5
+    # circuit opens at this failure share of at least min_calls in window seconds
+    breaker_failure_rate: float = 0.5
+    breaker_min_calls: int = 20
+    breaker_window: int = 10
+    breaker_probe_interval: float = 1.0
+    # RESP3 client tracking: hot keys under these prefixes are kept per worker
+    # and dropped on the server's invalidation pushes (Redis 6+); by default
+    # list versions, cached counts and ETags stored under CACHE__PREFIX
+    tracking_enabled: bool = False
+    tracking_prefixes: list[str] | None = None
+    tracking_max_entries: int = 10_000
+    tracking_ttl: float = 60.0
 
 
 class AccessToken(BaseModel):
     lifetime_seconds: int = 3600
+    # serve bearer tokens' users from Redis instead of two Postgres lookups
+    cache_enabled: bool = True
     reset_password_token_secret: str
     verification_token_secret: str
 
 
+class RouteCost(BaseModel):
+    cost: int = 1
+    group: str = "default"
+
+
+class RateLimiterMode(StrEnum):
+    # fastapi-limiter script per request
+    REDIS = "redis"
+    # local counts synced to Redis every sync_interval seconds, unsynced share
+    # capped by sync_margin
+    HYBRID = "hybrid"
+    # per-principal token budgets spent by route cost
+    WEIGHTED = "weighted"
+
+
 class RateLimiter(BaseModel):
     times: int = 10
     seconds: int = 60
+    mode: RateLimiterMode = RateLimiterMode.REDIS
+    sync_interval: float = 0.5
+    sync_margin: float = 0.1
+    # weighted mode: tokens per principal and route group every `seconds`
+    budgets: dict[str, int] = {"default": 120, "heavy": 600}
+    cost_classes: dict[str, RouteCost] = {
+        "default": RouteCost(),
+        "list": RouteCost(cost=2),
+        "many": RouteCost(cost=5),
+        "bulk": RouteCost(cost=20, group="heavy"),
+        "nested": RouteCost(cost=50, group="heavy"),
+    }
+    # "METHOD /path" -> cost class, overriding the path-based defaults
+    route_classes: dict[str, str] = {}
+    # reverse proxies whose X-Forwarded-For is believed; empty: the peer address
+    trusted_proxies: list[IPvAnyNetwork] = []
+
+
+class CountStrategy(StrEnum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+class PaginationConfig(BaseModel):
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cache_ttl: int = 60
+
+
+class CacheConfig(BaseModel):
+    prefix: str = "fastapi-cache"
+    ttl: int = 300
+    # in-process L1 in front of Redis, invalidated over pub/sub
+    local_enabled: bool = False
+    local_ttl: int = 30
+    local_max_entries: int = 1024
+    local_max_bytes: int = 16 * 1024 * 1024
+    # stampede control: stale serving window, expiry jitter, recompute lock
+    stale_ttl: int = 300
+    ttl_jitter: float = 0.1
+    early_refresh_beta: float = 1.0
+    lock_ttl: int = 10
+    lock_wait: float = 2.0
+    # cached bodies at least this big are stored zstd-compressed
+    compress_min_bytes: int = 1024
+    compress_level: int = 3
+    # lifetime of "not found" entries for lookups by id, username and email
+    negative_ttl: int = 30
+    # startup warm-up of hot entities, bounded by warm_timeout seconds
+    warm_enabled: bool = False
+    warm_timeout: float = 60.0
+    warm_concurrency: int = 4
+    warm_batch_size: int = 200
+    warm_window_days: int = 7
+    warm_categories: int = 1000
+    warm_top_products: int = 1000
+    warm_active_users: int = 1000
 
 
 class Settings(BaseSettings):
@@ -88,5 +185,7 @@ class Settings(BaseSettings):
     db: DatabaseConfig
     access_token: AccessToken
     rate_limiter: RateLimiter = RateLimiter()
+    pagination: PaginationConfig = PaginationConfig()
+    cache: CacheConfig = CacheConfig()
 
 settings = Settings()
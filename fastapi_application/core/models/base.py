@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import func, UUID, TIMESTAMP
+from sqlalchemy import func, UUID, TIMESTAMP, Index
 from sqlalchemy.orm import (
     DeclarativeBase,
     declared_attr,
@@ -17,6 +17,11 @@ class Base(DeclarativeBase):
     def __tablename__(cls):
         return f"{cls.__name__.lower()}s"
 
+    @declared_attr.directive
+    def __table_args__(cls):
+        # backs keyset pagination ordered by (created_at, id)
+        return (Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),)
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 class Product(Base):
 
-    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    name: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
     price: Mapped[int]
     description: Mapped[str]
     category_id: Mapped[uuid.UUID] = mapped_column(
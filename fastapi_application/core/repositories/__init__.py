@@ -0,0 +1,18 @@
+__all__ = (
+    "BaseRepository",
+    "obj_by_id_factory",
+    "SQLAlchemyCategoryRepository",
+    "SQLAlchemyOrderRepository",
+    "SQLAlchemyPostRepository",
+    "SQLAlchemyProductRepository",
+    "SQLAlchemyUserRepository",
+)
+
+
+from .base_repository import BaseRepository
+from .dependencies import obj_by_id_factory
+from .category_repository import SQLAlchemyCategoryRepository
+from .order_repository import SQLAlchemyOrderRepository
+from .post_repository import SQLAlchemyPostRepository
+from .product_repository import SQLAlchemyProductRepository
+from .user_repository import SQLAlchemyUserRepository
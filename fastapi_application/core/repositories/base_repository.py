@@ -4,8 +4,12 @@ from uuid import UUID
 
 from fastapi_pagination import Params, Page
 from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_application.core.config import settings
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
+
 
 logger = logging.getLogger(__name__)
 
@@ -15,20 +19,45 @@ UpdateSchemaT = TypeVar("UpdateSchemaT", bound=BaseModel)
 
 
 class BaseRepository(Protocol[ModelT]):
+    count_strategy: CountStrategy = settings.pagination.count_strategy
+
     async def get(self, session: AsyncSession, obj_id: UUID) -> ModelT | None: ...
     async def get_all(
-        self, session: AsyncSession, limit: int = 50, offset: int = 0
-    ) -> list[ModelT]: ...
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0,
+        projection: type[BaseModel] | None = None,
+    ) -> list[ModelT] | list[Row]: ...
+    async def get_all_by_cursor(
+        self, session: AsyncSession, limit: int = 50, cursor: str | None = None
+    ) -> KeysetPage[ModelT]: ...
     async def get_many(
-        self, session: AsyncSession, obj_ids: list[UUID | int]
-    ) -> list[ModelT]: ...
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID | int],
+        projection: type[BaseModel] | None = None,
+    ) -> list[ModelT] | list[Row]: ...
     async def get_multi_paginated(
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[ModelT]: ...
+    async def get_version(
+        self, session: AsyncSession, obj_id: UUID
+    ) -> str | None: ...
     async def create(self, session: AsyncSession, obj_data: dict) -> ModelT: ...
+    async def create_many(
+        self, session: AsyncSession, objs_data: list[dict]
+    ) -> list[ModelT]: ...
     async def update_partial(
         self, session: AsyncSession, obj: ModelT, obj_upd: dict
     ) -> ModelT: ...
+    async def update_many(
+        self, session: AsyncSession, obj_ids: list[UUID], values: dict
+    ) -> list[UUID]: ...
     async def delete(self, session: AsyncSession, obj: ModelT) -> None: ...
+    async def delete_many(
+        self, session: AsyncSession, obj_ids: list[UUID]
+    ) -> list[UUID]: ...
@@ -1,26 +1,40 @@
 import logging
+from typing import Sequence
 from uuid import UUID
 
 from fastapi_pagination import Params, Page
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import ARRAY, any_, bindparam, select, update, Row
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from fastapi_application.core.models import Category
+from fastapi_application.core.models import Category, Product
 from fastapi_application.core.repositories.base_repository import BaseRepository
 from fastapi_application.core.repositories.utils import (
     get_all_handler,
+    get_all_by_cursor_handler,
     get_handler,
     get_many_handler,
     get_multi_paginated_handler,
+    get_version_handler,
     update_partial_handler,
+    update_many_handler,
     delete_handler,
+    delete_many_handler,
     create_handler,
+    create_many_handler,
+    upsert_many_handler,
+    UpsertResult,
+    KeysetPage,
+    CountStrategy,
 )
 
 logger = logging.getLogger(__name__)
 
+# a category is just its name: existing ones are returned untouched
+UPSERT_FIELDS: tuple[str, ...] = ()
+
 
 class SQLAlchemyCategoryRepository(BaseRepository[Category]):
 
@@ -40,34 +54,64 @@ class SQLAlchemyCategoryRepository(BaseRepository[Category]):
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Category]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Category] | list[Row]:
         return await get_all_handler(
             Category,
             session,
             limit,
             offset,
+            projection,
+        )
+
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Category]:
+        return await get_all_by_cursor_handler(
+            Category,
+            session,
+            limit,
+            cursor,
         )
 
     async def get_many(
         self,
         session: AsyncSession,
         obj_ids: list[UUID],
-    ) -> list[Category]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Category] | list[Row]:
         return await get_many_handler(
             Category,
             session,
             obj_ids,
+            projection,
         )
 
     async def get_multi_paginated(
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Category]:
         return await get_multi_paginated_handler(
             Category,
             session,
             params,
+            count_strategy or self.count_strategy,
+        )
+
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+    ) -> str | None:
+        return await get_version_handler(
+            Category,
+            session,
+            obj_id,
         )
 
     async def create(
@@ -81,6 +125,52 @@ class SQLAlchemyCategoryRepository(BaseRepository[Category]):
             obj_data,
         )
 
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+    ) -> list[Category]:
+        return await create_many_handler(
+            Category,
+            session,
+            objs_data,
+        )
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        obj_data: dict,
+        update_fields: Sequence[str] = UPSERT_FIELDS,
+    ) -> UpsertResult[Category]:
+        return await self.upsert_many(session, [obj_data], update_fields)
+
+    async def upsert_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+        update_fields: Sequence[str] = UPSERT_FIELDS,
+    ) -> UpsertResult[Category]:
+        return await upsert_many_handler(
+            Category,
+            session,
+            objs_data,
+            "name",
+            update_fields,
+        )
+
+    async def update_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+        values: dict,
+    ) -> list[UUID]:
+        return await update_many_handler(
+            Category,
+            session,
+            obj_ids,
+            values,
+        )
+
     async def update_partial(
         self,
         session: AsyncSession,
@@ -103,6 +193,36 @@ class SQLAlchemyCategoryRepository(BaseRepository[Category]):
             obj,
         )
 
+    async def uncategorize_products(
+        self,
+        session: AsyncSession,
+        category_ids: list[UUID],
+    ) -> list[UUID]:
+        """Null products.category_id for the categories, as the ORM delete does."""
+        if not category_ids:
+            return []
+        ids = bindparam("category_ids", category_ids, type_=ARRAY(Category.id.type))
+        query = (
+            update(Product)
+            .where(Product.category_id == any_(ids))
+            .values(category_id=None)
+            .returning(Product.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> list[UUID]:
+        return await delete_many_handler(
+            Category,
+            session,
+            obj_ids,
+        )
+
     async def get_with_products(
         self,
         session: AsyncSession,
@@ -125,3 +245,22 @@ class SQLAlchemyCategoryRepository(BaseRepository[Category]):
         result: Result = await session.execute(query)
         category = result.scalar_one_or_none()
         return category
+
+    async def get_by_names(
+        self,
+        session: AsyncSession,
+        category_names: list[str],
+    ) -> list[Category]:
+        if not category_names:
+            return []
+        query = select(Category).where(Category.name.in_(category_names))
+        result: Result = await session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_ids(
+        self,
+        session: AsyncSession,
+        limit: int,
+    ) -> list[UUID]:
+        query = select(Category.id).order_by(Category.name).limit(limit)
+        return list(await session.scalars(query))
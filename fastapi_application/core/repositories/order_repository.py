@@ -1,8 +1,22 @@
 import logging
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi_pagination import Params, Page
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import (
+    select,
+    insert,
+    delete,
+    func,
+    any_,
+    bindparam,
+    literal,
+    true,
+    Row,
+    ARRAY,
+    Integer,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.engine import Result
@@ -10,12 +24,23 @@ from sqlalchemy.engine import Result
 from fastapi_application.core.models import Order, OrderProductAssociation, Product
 from fastapi_application.core.repositories.base_repository import BaseRepository
 from fastapi_application.core.repositories.utils import (
+    get_all_handler,
+    get_all_by_cursor_handler,
     get_handler,
+    get_many_handler,
     get_multi_paginated_handler,
+    get_version_handler,
     update_partial_handler,
+    update_many_handler,
     delete_handler,
+    delete_many_handler,
     create_handler,
+    create_many_handler,
+    KeysetPage,
+    CountStrategy,
+    projected_columns,
 )
+from fastapi_application.core.schemas.product_schema import ProductSchema
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +64,17 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
         limit: int = 50,
         offset: int = 0,
         with_assoc: bool = False,
-    ) -> list[Order]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Order] | list[Row]:
+        if projection and not with_assoc:
+            return await get_all_handler(
+                Order,
+                session,
+                limit,
+                offset,
+                projection,
+            )
+
         if with_assoc:
             query = (
                 select(Order)
@@ -57,15 +92,46 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
         res: Result = await session.execute(query)
         return list(res.scalars().all())
 
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+        with_assoc: bool = False,
+    ) -> KeysetPage[Order]:
+        options = ()
+        if with_assoc:
+            options = (
+                selectinload(Order.products_details).selectinload(
+                    OrderProductAssociation.product
+                ),
+            )
+        return await get_all_by_cursor_handler(
+            Order,
+            session,
+            limit,
+            cursor,
+            options,
+        )
+
     async def get_many(
         self,
         session: AsyncSession,
         obj_ids: list[UUID],
         with_assoc: bool = False,
-    ) -> list[Order]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Order] | list[Row]:
         if not obj_ids:
             return []
 
+        if projection and not with_assoc:
+            return await get_many_handler(
+                Order,
+                session,
+                obj_ids,
+                projection,
+            )
+
         if with_assoc:
             query = (
                 select(Order)
@@ -85,11 +151,24 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Order]:
         return await get_multi_paginated_handler(
             Order,
             session,
             params,
+            count_strategy or self.count_strategy,
+        )
+
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+    ) -> str | None:
+        return await get_version_handler(
+            Order,
+            session,
+            obj_id,
         )
 
     async def create(
@@ -103,6 +182,30 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
             obj_data,
         )
 
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+    ) -> list[Order]:
+        return await create_many_handler(
+            Order,
+            session,
+            objs_data,
+        )
+
+    async def update_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+        values: dict,
+    ) -> list[UUID]:
+        return await update_many_handler(
+            Order,
+            session,
+            obj_ids,
+            values,
+        )
+
     async def update_partial(
         self,
         session: AsyncSession,
@@ -125,35 +228,92 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
             obj,
         )
 
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> list[UUID]:
+        return await delete_many_handler(
+            Order,
+            session,
+            obj_ids,
+        )
+
     async def create_order_with_products(
         self,
         session: AsyncSession,
         obj_data: dict,
-        products: dict[UUID, Product],
-    ) -> Order | None:
-        order_data = obj_data.copy()
-        order_data.pop("products")
-        order = Order(**order_data)
-
-        session.add(order)
-        await session.flush()
+    ) -> dict:
+        """Insert the order and its lines in one statement.
 
+        Lines are inserted from unnest(product_ids, counts) joined to products,
+        so unit_price is snapshotted in SQL and unknown products produce no
+        line. Returns the order document without re-reading it.
+        """
+        order_id = uuid4()
+        counts: dict[UUID, int] = {}
         for item in obj_data.get("products", []):
-            product_inst = products.get(item.get("product_id"))
-            if not product_inst:
-                raise ValueError(
-                    f"Product with id {item.get("product_id")} does not exist"
-                )
-            assoc = OrderProductAssociation(
-                order_id=order.id,
-                product_id=item.get("product_id"),
-                count=item.get("count"),
-                unit_price=product_inst.price,
+            product_id = item["product_id"]
+            counts[product_id] = counts.get(product_id, 0) + item["count"]
+
+        new_order = (
+            insert(Order)
+            .values(
+                id=order_id,
+                user_id=obj_data.get("user_id"),
+                promo_code=obj_data.get("promo_code"),
             )
-            session.add(assoc)
+            .returning(Order.id)
+            .cte("new_order")
+        )
+        items = (
+            func.unnest(
+                bindparam("product_ids", list(counts), type_=ARRAY(PG_UUID)),
+                bindparam("counts", list(counts.values()), type_=ARRAY(Integer)),
+            )
+            .table_valued("product_id", "count")
+            .render_derived(name="items")
+        )
+        lines = (
+            insert(OrderProductAssociation)
+            .from_select(
+                ["order_id", "product_id", "count", "unit_price"],
+                select(new_order.c.id, Product.id, items.c.count, Product.price)
+                .select_from(new_order)
+                .join(items, true())
+                .join(Product, Product.id == items.c.product_id),
+            )
+            .returning(
+                OrderProductAssociation.product_id,
+                OrderProductAssociation.count,
+                OrderProductAssociation.unit_price,
+            )
+            .cte("lines")
+        )
+        product_columns = projected_columns(Product, ProductSchema)
+        query = select(lines.c.count, lines.c.unit_price, *product_columns).join_from(
+            lines, Product, Product.id == lines.c.product_id
+        )
 
-        await session.flush()
-        return order
+        result = await session.execute(query)
+        products_details = [
+            {
+                "count": row.count,
+                "unit_price": row.unit_price,
+                "product": {c.key: row._mapping[c.key] for c in product_columns},
+            }
+            for row in result
+        ]
+        logger.debug(
+            "Order inserted with lines",
+            extra={"id": str(order_id), "lines": len(products_details)},
+        )
+        return {
+            "id": order_id,
+            "user_id": obj_data.get("user_id"),
+            "promo_code": obj_data.get("promo_code"),
+            "products_details": products_details,
+        }
 
     async def update_partial_with_products(
         self,
@@ -162,33 +322,100 @@ class SQLAlchemyOrderRepository(BaseRepository[Order]):
         obj_upd: dict,
     ) -> Order:
         for name, value in obj_upd.items():
-            if name != "products_data" and name != "products":
+            if name != "products_data":
                 setattr(obj, name, value)
+        await session.flush()
 
-        for upd_product in obj_upd.get("products_data", []):
-            assoc = next(
-                (
-                    p
-                    for p in obj.products_details
-                    if p.product_id == upd_product["product_id"]
-                ),
-                None,
-            )
-            product_inst = obj_upd.get("products", {}).get(upd_product["product_id"])
-            if not product_inst:
-                raise ValueError(f"Product {upd_product['product_id']} not found")
+        result = await session.execute(
+            select(
+                OrderProductAssociation.product_id,
+                OrderProductAssociation.count,
+            ).where(OrderProductAssociation.order_id == obj.id)
+        )
+        current: dict[UUID, int] = {row.product_id: row.count for row in result}
 
-            if assoc:
-                assoc.count = upd_product.get("count", assoc.count)
-                assoc.unit_price = product_inst.price
+        upserts: dict[UUID, int] = {}
+        removals: set[UUID] = set()
+        for upd_product in obj_upd.get("products_data") or []:
+            product_id = upd_product["product_id"]
+            count = upd_product.get("count")
+            if count is None:
+                count = current.get(product_id, 1)
+            if count == 0:
+                upserts.pop(product_id, None)
+                if product_id in current:
+                    removals.add(product_id)
             else:
-                assoc = OrderProductAssociation(
-                    order_id=obj.id,
-                    product_id=upd_product["product_id"],
-                    count=upd_product.get("count", 0),
-                    unit_price=product_inst.price,
+                upserts[product_id] = count
+                removals.discard(product_id)
+
+        if upserts:
+            await self._upsert_lines(session, obj.id, upserts)
+        if removals:
+            removal_ids = bindparam(
+                "product_ids", list(removals), type_=ARRAY(PG_UUID)
+            )
+            await session.execute(
+                delete(OrderProductAssociation)
+                .where(OrderProductAssociation.order_id == obj.id)
+                .where(OrderProductAssociation.product_id == any_(removal_ids))
+            )
+        logger.debug(
+            "Order lines diff applied",
+            extra={
+                "id": str(obj.id),
+                "upserts": len(upserts),
+                "removals": len(removals),
+            },
+        )
+
+        query = (
+            select(Order)
+            .options(
+                selectinload(Order.products_details).selectinload(
+                    OrderProductAssociation.product
                 )
-                obj.products_details.append(assoc)
+            )
+            .where(Order.id == obj.id)
+            .execution_options(populate_existing=True)
+        )
+        return (await session.scalars(query)).one()
 
-        await session.flush()
-        return obj
+    async def _upsert_lines(
+        self,
+        session: AsyncSession,
+        order_id: UUID,
+        counts: dict[UUID, int],
+    ) -> None:
+        items = (
+            func.unnest(
+                bindparam("product_ids", list(counts), type_=ARRAY(PG_UUID)),
+                bindparam("counts", list(counts.values()), type_=ARRAY(Integer)),
+            )
+            .table_valued("product_id", "count")
+            .render_derived(name="items")
+        )
+        query = pg_insert(OrderProductAssociation).from_select(
+            ["order_id", "product_id", "count", "unit_price"],
+            select(
+                literal(order_id, PG_UUID),
+                Product.id,
+                items.c.count,
+                Product.price,
+            )
+            .select_from(items)
+            .join(Product, Product.id == items.c.product_id),
+        )
+        query = query.on_conflict_do_update(
+            constraint="idx_unique_order_product",
+            set_={
+                "count": query.excluded.count,
+                "unit_price": query.excluded.unit_price,
+                "updated_at": func.now(),
+            },
+        ).returning(OrderProductAssociation.product_id)
+
+        result = await session.execute(query)
+        missing = set(counts) - set(result.scalars().all())
+        if missing:
+            raise ValueError(f"Products not found: {', '.join(map(str, missing))}")
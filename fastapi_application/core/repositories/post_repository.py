@@ -2,18 +2,27 @@ import logging
 from uuid import UUID
 
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_application.core.models import Post
 from fastapi_application.core.repositories.base_repository import BaseRepository
 from fastapi_application.core.repositories.utils import (
     get_all_handler,
+    get_all_by_cursor_handler,
     get_handler,
     get_many_handler,
     get_multi_paginated_handler,
+    get_version_handler,
     update_partial_handler,
+    update_many_handler,
     delete_handler,
+    delete_many_handler,
     create_handler,
+    create_many_handler,
+    KeysetPage,
+    CountStrategy,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,34 +46,64 @@ class SQLAlchemyPostRepository(BaseRepository[Post]):
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Post]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Post] | list[Row]:
         return await get_all_handler(
             Post,
             session,
             limit,
             offset,
+            projection,
+        )
+
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Post]:
+        return await get_all_by_cursor_handler(
+            Post,
+            session,
+            limit,
+            cursor,
         )
 
     async def get_many(
         self,
         session: AsyncSession,
         obj_ids: list[UUID],
-    ) -> list[Post]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Post] | list[Row]:
         return await get_many_handler(
             Post,
             session,
             obj_ids,
+            projection,
         )
 
     async def get_multi_paginated(
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Post]:
         return await get_multi_paginated_handler(
             Post,
             session,
             params,
+            count_strategy or self.count_strategy,
+        )
+
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+    ) -> str | None:
+        return await get_version_handler(
+            Post,
+            session,
+            obj_id,
         )
 
     async def create(
@@ -78,6 +117,30 @@ class SQLAlchemyPostRepository(BaseRepository[Post]):
             obj_data,
         )
 
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+    ) -> list[Post]:
+        return await create_many_handler(
+            Post,
+            session,
+            objs_data,
+        )
+
+    async def update_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+        values: dict,
+    ) -> list[UUID]:
+        return await update_many_handler(
+            Post,
+            session,
+            obj_ids,
+            values,
+        )
+
     async def update_partial(
         self,
         session: AsyncSession,
@@ -99,3 +162,14 @@ class SQLAlchemyPostRepository(BaseRepository[Post]):
             session,
             obj,
         )
+
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> list[UUID]:
+        return await delete_many_handler(
+            Post,
+            session,
+            obj_ids,
+        )
@@ -1,23 +1,43 @@
 import logging
+from datetime import datetime
+from typing import Sequence
 from uuid import UUID
 
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_application.core.models import Product
+from fastapi_application.core.models import (
+    Product,
+    Order,
+    OrderProductAssociation,
+)
 from fastapi_application.core.repositories.base_repository import BaseRepository
 from fastapi_application.core.repositories.utils import (
     get_all_handler,
+    get_all_by_cursor_handler,
     get_handler,
     get_many_handler,
     get_multi_paginated_handler,
+    get_version_handler,
     update_partial_handler,
+    update_many_handler,
     delete_handler,
+    delete_many_handler,
     create_handler,
+    create_many_handler,
+    upsert_many_handler,
+    UpsertResult,
+    KeysetPage,
+    CountStrategy,
 )
 
 logger = logging.getLogger(__name__)
 
+# columns overwritten by ON CONFLICT (name) DO UPDATE
+UPSERT_FIELDS = ("price", "description", "category_id")
+
 
 class SQLAlchemyProductRepository(BaseRepository[Product]):
 
@@ -37,34 +57,64 @@ class SQLAlchemyProductRepository(BaseRepository[Product]):
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Product]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Product] | list[Row]:
         return await get_all_handler(
             Product,
             session,
             limit,
             offset,
+            projection,
+        )
+
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Product]:
+        return await get_all_by_cursor_handler(
+            Product,
+            session,
+            limit,
+            cursor,
         )
 
     async def get_many(
         self,
         session: AsyncSession,
         obj_ids: list[UUID],
-    ) -> list[Product]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Product] | list[Row]:
         return await get_many_handler(
             Product,
             session,
             obj_ids,
+            projection,
         )
 
     async def get_multi_paginated(
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Product]:
         return await get_multi_paginated_handler(
             Product,
             session,
             params,
+            count_strategy or self.count_strategy,
+        )
+
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+    ) -> str | None:
+        return await get_version_handler(
+            Product,
+            session,
+            obj_id,
         )
 
     async def create(
@@ -78,6 +128,52 @@ class SQLAlchemyProductRepository(BaseRepository[Product]):
             obj_data,
         )
 
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+    ) -> list[Product]:
+        return await create_many_handler(
+            Product,
+            session,
+            objs_data,
+        )
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        obj_data: dict,
+        update_fields: Sequence[str] = UPSERT_FIELDS,
+    ) -> UpsertResult[Product]:
+        return await self.upsert_many(session, [obj_data], update_fields)
+
+    async def upsert_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+        update_fields: Sequence[str] = UPSERT_FIELDS,
+    ) -> UpsertResult[Product]:
+        return await upsert_many_handler(
+            Product,
+            session,
+            objs_data,
+            "name",
+            update_fields,
+        )
+
+    async def update_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+        values: dict,
+    ) -> list[UUID]:
+        return await update_many_handler(
+            Product,
+            session,
+            obj_ids,
+            values,
+        )
+
     async def update_partial(
         self,
         session: AsyncSession,
@@ -99,3 +195,31 @@ class SQLAlchemyProductRepository(BaseRepository[Product]):
             session,
             obj,
         )
+
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> list[UUID]:
+        return await delete_many_handler(
+            Product,
+            session,
+            obj_ids,
+        )
+
+    async def get_top_ordered_ids(
+        self,
+        session: AsyncSession,
+        limit: int,
+        since: datetime,
+    ) -> list[UUID]:
+        """Ids of the products with the most units ordered since the given time."""
+        query = (
+            select(OrderProductAssociation.product_id)
+            .join(Order, Order.id == OrderProductAssociation.order_id)
+            .where(Order.created_at >= since)
+            .group_by(OrderProductAssociation.product_id)
+            .order_by(func.sum(OrderProductAssociation.count).desc())
+            .limit(limit)
+        )
+        return list(await session.scalars(query))
@@ -1,26 +1,88 @@
 import logging
+from datetime import datetime
 from uuid import UUID
 
 from fastapi_pagination import Params, Page
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import select, Row, func, literal_column, Text, union_all
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.engine import Result
 from sqlalchemy.orm import selectinload
 
-from fastapi_application.core.models import User, Order, OrderProductAssociation
+from fastapi_application.core.cache.negative import is_known_missing, remember_missing
+from fastapi_application.core.models import (
+    User,
+    Order,
+    OrderProductAssociation,
+    Post,
+    Product,
+)
 from fastapi_application.core.repositories.base_repository import BaseRepository
 from fastapi_application.core.repositories.utils import (
     get_all_handler,
+    get_all_by_cursor_handler,
     get_handler,
     get_many_handler,
     get_multi_paginated_handler,
+    get_version_handler,
     update_partial_handler,
+    update_many_handler,
     delete_handler,
+    delete_many_handler,
     create_handler,
+    create_many_handler,
+    KeysetPage,
+    CountStrategy,
+    json_object_for,
+)
+from fastapi_application.core.schemas.product_schema import ProductSchema
+from fastapi_application.core.schemas.user_schema import (
+    UserSchema,
+    OrderIn,
+    OrderProductAssociationSchema,
 )
 
 logger = logging.getLogger(__name__)
 
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def user_with_orders_json():
+    """Correlated json_build_object for UserSchemaWithOrders, built in Postgres."""
+    products_details = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    json_object_for(
+                        OrderProductAssociation,
+                        OrderProductAssociationSchema,
+                        product=json_object_for(Product, ProductSchema),
+                    )
+                ),
+                EMPTY_JSON_ARRAY,
+            )
+        )
+        .select_from(OrderProductAssociation)
+        .join(Product, Product.id == OrderProductAssociation.product_id)
+        .where(OrderProductAssociation.order_id == Order.id)
+        .scalar_subquery()
+    )
+    orders = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    json_object_for(Order, OrderIn, products_details=products_details)
+                ),
+                EMPTY_JSON_ARRAY,
+            )
+        )
+        .select_from(Order)
+        .where(Order.user_id == User.id)
+        .scalar_subquery()
+    )
+    return json_object_for(User, UserSchema, orders=orders)
+
 
 class SQLAlchemyUserRepository(BaseRepository[User]):
 
@@ -40,34 +102,64 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[User]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[User] | list[Row]:
         return await get_all_handler(
             User,
             session,
             limit,
             offset,
+            projection,
+        )
+
+    async def get_all_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[User]:
+        return await get_all_by_cursor_handler(
+            User,
+            session,
+            limit,
+            cursor,
         )
 
     async def get_many(
         self,
         session: AsyncSession,
         obj_ids: list[UUID],
-    ) -> list[User]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[User] | list[Row]:
         return await get_many_handler(
             User,
             session,
             obj_ids,
+            projection,
         )
 
     async def get_multi_paginated(
         self,
         session: AsyncSession,
         params: Params,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[User]:
         return await get_multi_paginated_handler(
             User,
             session,
             params,
+            count_strategy or self.count_strategy,
+        )
+
+    async def get_version(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+    ) -> str | None:
+        return await get_version_handler(
+            User,
+            session,
+            obj_id,
         )
 
     async def create(
@@ -81,6 +173,30 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
             obj_data,
         )
 
+    async def create_many(
+        self,
+        session: AsyncSession,
+        objs_data: list[dict],
+    ) -> list[User]:
+        return await create_many_handler(
+            User,
+            session,
+            objs_data,
+        )
+
+    async def update_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+        values: dict,
+    ) -> list[UUID]:
+        return await update_many_handler(
+            User,
+            session,
+            obj_ids,
+            values,
+        )
+
     async def update_partial(
         self,
         session: AsyncSession,
@@ -103,14 +219,29 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
             obj,
         )
 
+    async def delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> list[UUID]:
+        return await delete_many_handler(
+            User,
+            session,
+            obj_ids,
+        )
+
     async def get_by_username(
         self,
         session: AsyncSession,
         username: str,
     ) -> User | None:
+        if await is_known_missing(User, "username", username):
+            return None
         query = select(User).where(User.username == username)
         result: Result = await session.execute(query)
         user = result.scalar_one_or_none()
+        if user is None:
+            await remember_missing(User, "username", username)
         return user
 
     async def get_by_email(
@@ -118,9 +249,13 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
         session: AsyncSession,
         email: str,
     ) -> User | None:
+        if await is_known_missing(User, "email", email):
+            return None
         query = select(User).where(User.email == email)
         result: Result = await session.execute(query)
         user = result.scalar_one_or_none()
+        if user is None:
+            await remember_missing(User, "email", email)
         return user
 
     async def get_with_posts(
@@ -154,6 +289,7 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
                 .selectinload(OrderProductAssociation.product)
             )
             .where(User.orders.any())
+            .order_by(User.created_at, User.id)
             .limit(limit)
             .offset(offset)
         )
@@ -196,7 +332,84 @@ class SQLAlchemyUserRepository(BaseRepository[User]):
             )
             .where(User.orders.any())
             .where(User.id.in_(obj_ids))
+            .order_by(User.created_at, User.id)
         )
         users = await session.scalars(query)
 
         return list(users)
+
+    async def get_with_orders_json(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> str:
+        users = (
+            select(
+                user_with_orders_json().label("doc"),
+                User.created_at,
+                User.id,
+            )
+            .where(User.orders.any())
+            .order_by(User.created_at, User.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        query = select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(users.c.doc, users.c.created_at, users.c.id)
+                ),
+                EMPTY_JSON_ARRAY,
+            ).cast(Text)
+        )
+        return await session.scalar(query)
+
+    async def get_many_with_orders_json(
+        self,
+        session: AsyncSession,
+        obj_ids: list[UUID],
+    ) -> str:
+        if not obj_ids:
+            return "[]"
+
+        users = (
+            select(
+                user_with_orders_json().label("doc"),
+                User.created_at,
+                User.id,
+            )
+            .where(User.orders.any())
+            .where(User.id.in_(obj_ids))
+            .subquery()
+        )
+        query = select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(users.c.doc, users.c.created_at, users.c.id)
+                ),
+                EMPTY_JSON_ARRAY,
+            ).cast(Text)
+        )
+        return await session.scalar(query)
+
+    async def get_recently_active_ids(
+        self,
+        session: AsyncSession,
+        limit: int,
+        since: datetime,
+    ) -> list[UUID]:
+        """Ids of the users with the latest orders or posts since the given time."""
+        activity = union_all(
+            select(Order.user_id, Order.created_at).where(Order.created_at >= since),
+            select(Post.user_id, Post.created_at).where(Post.created_at >= since),
+        ).subquery()
+        query = (
+            select(activity.c.user_id)
+            .where(activity.c.user_id.is_not(None))
+            .group_by(activity.c.user_id)
+            .order_by(func.max(activity.c.created_at).desc())
+            .limit(limit)
+        )
+        return list(await session.scalars(query))
@@ -1,11 +1,44 @@
+import base64
+import binascii
 import logging
-from typing import TypeVar, Type
+from datetime import datetime
+from functools import lru_cache
+from math import ceil
+from typing import TypeVar, Type, NamedTuple, Generic, Sequence
 from uuid import UUID
 
+import orjson
+from fastapi import HTTPException
 from fastapi_pagination import Params, Page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    tuple_,
+    func,
+    any_,
+    bindparam,
+    Select,
+    Row,
+    BigInteger,
+    cast,
+    literal_column,
+    table,
+)
+from sqlalchemy import ARRAY, DateTime, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from fastapi_application.core.cache.negative import is_known_missing, remember_missing
+from fastapi_application.core.cache.versions import invalidate_lists
+from fastapi_application.core.config import CountStrategy, settings
+from redis_conf.redis import AsyncRedisClient
 
 
 logger = logging.getLogger(__name__)
@@ -14,44 +47,239 @@ logger = logging.getLogger(__name__)
 ModelT = TypeVar("ModelT", covariant=True)
 
 
+class KeysetPage(NamedTuple, Generic[ModelT]):
+    items: list[ModelT]
+    next_cursor: str | None
+
+
+class UpsertResult(NamedTuple, Generic[ModelT]):
+    # every upserted row, in input order
+    items: list[ModelT]
+    # rows actually inserted or modified
+    changed: list[ModelT]
+
+
+def encode_cursor(created_at: datetime, obj_id: UUID) -> str:
+    raw = orjson.dumps([created_at.isoformat(), str(obj_id)])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, obj_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), UUID(obj_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@lru_cache
+def projected_columns(model: Type[ModelT], projection: Type[BaseModel]) -> tuple:
+    column_names = sa_inspect(model).column_attrs.keys()
+    return tuple(
+        getattr(model, name)
+        for name in projection.model_fields
+        if name in column_names
+    )
+
+
+def json_timestamp(column):
+    """ISO 8601 UTC text the way pydantic dumps it: "Z", no ".000000"."""
+    utc = func.timezone("UTC", column)
+    return case(
+        (
+            func.date_trunc("second", column) == column,
+            func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+        ),
+        else_=func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'),
+    )
+
+
+def json_object_for(
+    model: Type[ModelT],
+    schema: Type[BaseModel],
+    **nested,
+):
+    """json_build_object() over the schema's columns plus nested documents."""
+    pairs = []
+    for column in projected_columns(model, schema):
+        if isinstance(column.type, DateTime):
+            pairs += [column.key, json_timestamp(column)]
+        else:
+            pairs += [column.key, column]
+    for key, value in nested.items():
+        pairs += [key, value]
+    return func.json_build_object(*pairs)
+
+
+def select_projected(
+    model: Type[ModelT],
+    projection: Type[BaseModel] | None = None,
+) -> Select:
+    # plain column select: rows come back as slotted Row tuples and skip the identity map
+    if projection is None:
+        return select(model)
+    return select(*projected_columns(model, projection))
+
+
 async def get_all_handler(
     model: Type[ModelT],
     session: AsyncSession,
     limit: int = 50,
     offset: int = 0,
-) -> list[ModelT]:
-    query = select(model).limit(limit).offset(offset)
+    projection: Type[BaseModel] | None = None,
+) -> list[ModelT] | list[Row]:
+    query = select_projected(model, projection).limit(limit).offset(offset)
     res = await session.execute(query)
+    if projection:
+        return list(res.all())
     return list(res.scalars().all())
 
 
-async def sget_handler(
+async def get_all_by_cursor_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    limit: int = 50,
+    cursor: str | None = None,
+    options: Sequence[LoaderOption] = (),
+) -> KeysetPage[ModelT]:
+    query = (
+        select(model)
+        .options(*options)
+        .order_by(model.created_at, model.id)
+        .limit(limit + 1)
+    )
+    if cursor:
+        created_at, obj_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(model.created_at, model.id) > tuple_(created_at, obj_id)
+        )
+
+    res = await session.execute(query)
+    rows = list(res.scalars().all())
+
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return KeysetPage(items, next_cursor)
+
+
+async def get_handler(
     model: Type[ModelT],
     session: AsyncSession,
     obj_id: UUID,
 ) -> ModelT | None:
-    return await session.get(model, obj_id)
+    if await is_known_missing(model, "id", obj_id):
+        return None
+    obj = await session.get(model, obj_id)
+    if obj is None:
+        await remember_missing(model, "id", obj_id)
+    return obj
 
 
 async def get_many_handler(
     model: Type[ModelT],
     session: AsyncSession,
     obj_ids: list[UUID],
-) -> list[ModelT]:
+    projection: Type[BaseModel] | None = None,
+) -> list[ModelT] | list[Row]:
     if not obj_ids:
         return []
-    query = select(model).where(model.id.in_(obj_ids))
+    query = select_projected(model, projection).where(model.id.in_(obj_ids))
     result = await session.execute(query)
+    if projection:
+        return list(result.all())
     return list(result.scalars().all())
 
 
+async def get_version_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    obj_id: UUID,
+) -> str | None:
+    if await is_known_missing(model, "id", obj_id):
+        return None
+    updated_at = await session.scalar(
+        select(model.updated_at).where(model.id == obj_id)
+    )
+    if updated_at is None:
+        return None
+    return f"{obj_id}:{updated_at.isoformat()}"
+
+
+def estimated_count_query(model: Type[ModelT]) -> Select:
+    # planner statistics, refreshed by autovacuum/ANALYZE; reltuples is -1 until
+    # the first analyze, and the exact count is only run in that case
+    reltuples = (
+        select(literal_column("reltuples"))
+        .select_from(table("pg_class"))
+        .where(literal_column("oid") == func.to_regclass(model.__tablename__))
+        .scalar_subquery()
+    )
+    exact = select(func.count()).select_from(model).scalar_subquery()
+    return select(case((reltuples >= 0, cast(reltuples, BigInteger)), else_=exact))
+
+
+async def cached_count(
+    model: Type[ModelT],
+    session: AsyncSession,
+) -> int:
+    client = await AsyncRedisClient.get_client()
+    key = f"count:{model.__tablename__}"
+
+    try:
+        cached = await AsyncRedisClient.get_tracked(key)
+    except RedisError as e:
+        logger.warning("Failed to read %s count from Redis: %s", model.__name__, e)
+        cached = None
+    if cached is not None:
+        return int(cached)
+
+    total = await session.scalar(select(func.count()).select_from(model))
+    try:
+        await client.set(key, total, ex=settings.pagination.count_cache_ttl)
+    except RedisError as e:
+        logger.warning("Failed to cache %s count: %s", model.__name__, e)
+        return total
+    logger.debug("%s count cached", model.__name__, extra={"total": total})
+    return total
+
+
 async def get_multi_paginated_handler(
     model: Type[ModelT],
     session: AsyncSession,
     params: Params,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
 ) -> Page[ModelT]:
     query = select(model)
-    return await paginate(session, query, params, unwrap_mode="auto")
+
+    if count_strategy == CountStrategy.EXACT:
+        return await paginate(session, query, params, unwrap_mode="auto")
+    if count_strategy == CountStrategy.ESTIMATED:
+        return await paginate(
+            session,
+            query,
+            params,
+            unwrap_mode="auto",
+            count_query=estimated_count_query(model),
+        )
+
+    total = None
+    if count_strategy == CountStrategy.CACHED:
+        total = await cached_count(model, session)
+
+    raw_params = params.to_raw_params()
+    res = await session.execute(
+        query.limit(raw_params.limit).offset(raw_params.offset)
+    )
+    # constructed without validation: total/pages stay None when omitted
+    return Page.model_construct(
+        items=list(res.scalars().all()),
+        total=total,
+        page=params.page,
+        size=params.size,
+        pages=ceil(total / params.size) if total is not None else None,
+    )
 
 
 async def create_handler(
@@ -70,6 +298,80 @@ async def create_handler(
     return model_instance
 
 
+async def create_many_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    objs_data: list[dict],
+) -> list[ModelT]:
+    if not objs_data:
+        return []
+    # executemany with RETURNING is batched into multi-row INSERT ... VALUES
+    query = insert(model).returning(model, sort_by_parameter_order=True)
+    result = await session.scalars(query, objs_data)
+    instances = list(result.all())
+    logger.debug(
+        "%s bulk inserted",
+        model.__name__,
+        extra={"count": len(instances)},
+    )
+    return instances
+
+
+async def upsert_many_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    objs_data: list[dict],
+    conflict_field: str = "name",
+    update_fields: Sequence[str] = (),
+) -> UpsertResult[ModelT]:
+    """INSERT ... ON CONFLICT (conflict_field) DO UPDATE SET update_fields.
+
+    Conflicting rows are only updated (and updated_at bumped) when one of
+    update_fields differs; with no update_fields they are left alone (DO
+    NOTHING). Rows left untouched are read back with one SELECT, and list
+    cache versions are only bumped when something changed.
+    """
+    if not objs_data:
+        return UpsertResult([], [])
+    query = pg_insert(model)
+    if update_fields:
+        target = tuple_(*(model.__table__.c[field] for field in update_fields))
+        excluded = tuple_(*(query.excluded[field] for field in update_fields))
+        query = query.on_conflict_do_update(
+            index_elements=[conflict_field],
+            set_={
+                **{field: query.excluded[field] for field in update_fields},
+                "updated_at": func.now(),
+            },
+            where=target.is_distinct_from(excluded),
+        )
+    else:
+        query = query.on_conflict_do_nothing(index_elements=[conflict_field])
+
+    result = await session.scalars(
+        query.returning(model),
+        objs_data,
+        execution_options={"populate_existing": True, "track_versions": False},
+    )
+    changed = list(result.all())
+    if changed:
+        invalidate_lists(session, model)
+
+    by_key = {getattr(obj, conflict_field): obj for obj in changed}
+    unchanged = [data[conflict_field] for data in objs_data]
+    unchanged = [key for key in dict.fromkeys(unchanged) if key not in by_key]
+    if unchanged:
+        column = getattr(model, conflict_field)
+        result = await session.scalars(
+            select(model).where(column.in_(unchanged)),
+            execution_options={"populate_existing": True},
+        )
+        by_key.update((getattr(obj, conflict_field), obj) for obj in result.all())
+
+    keys = dict.fromkeys(data[conflict_field] for data in objs_data)
+    return UpsertResult([by_key[key] for key in keys if key in by_key], changed)
+
+
 async def update_partial_handler(
     session: AsyncSession,
     obj: Type[ModelT],
@@ -81,6 +383,47 @@ async def update_partial_handler(
     return obj
 
 
+def ids_any(model: Type[ModelT], obj_ids: list[UUID]):
+    # single array parameter: id = ANY($1) keeps one prepared statement for any batch size
+    return model.id == any_(bindparam("obj_ids", obj_ids, type_=ARRAY(model.id.type)))
+
+
+async def update_many_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    obj_ids: list[UUID],
+    values: dict,
+) -> list[UUID]:
+    if not obj_ids or not values:
+        return []
+    query = (
+        update(model)
+        .where(ids_any(model, obj_ids))
+        .values(**values)
+        .returning(model.id)
+        .execution_options(synchronize_session="fetch")
+    )
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
+async def delete_many_handler(
+    model: Type[ModelT],
+    session: AsyncSession,
+    obj_ids: list[UUID],
+) -> list[UUID]:
+    if not obj_ids:
+        return []
+    query = (
+        delete(model)
+        .where(ids_any(model, obj_ids))
+        .returning(model.id)
+        .execution_options(synchronize_session="fetch")
+    )
+    result = await session.execute(query)
+    return list(result.scalars().all())
+
+
 async def delete_handler(
     session: AsyncSession,
     obj: Type[ModelT],
@@ -0,0 +1,33 @@
+import uuid
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+
+ItemT = TypeVar("ItemT")
+
+
+class BulkItemErrorSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    index: int
+    error: str
+
+
+class BulkCreateSchema(BaseModel, Generic[ItemT]):
+    model_config = ConfigDict(from_attributes=True)
+
+    items: list[ItemT]
+    errors: list[BulkItemErrorSchema] = []
+
+
+class BulkUpdateSchema(BaseModel, Generic[ItemT]):
+    ids: list[uuid.UUID]
+    values: ItemT
+
+
+class BulkIdsSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    ids: list[uuid.UUID]
+    not_found: list[uuid.UUID] = []
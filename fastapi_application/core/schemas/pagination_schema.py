@@ -0,0 +1,23 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+
+ItemT = TypeVar("ItemT")
+
+
+class CursorPageSchema(BaseModel, Generic[ItemT]):
+    model_config = ConfigDict(from_attributes=True)
+
+    items: list[ItemT]
+    next_cursor: str | None = None
+
+
+class PageSchema(BaseModel, Generic[ItemT]):
+    model_config = ConfigDict(from_attributes=True)
+
+    items: list[ItemT]
+    page: int
+    size: int
+    total: int | None = None
+    pages: int | None = None
@@ -23,6 +23,12 @@ class ProductUpdatePartial(ProductBase):
     category_name: str | None = None
 
 
+class ProductUpsert(BaseModel):
+    price: int
+    description: str
+    category_name: str | None = None
+
+
 class ProductSchema(ProductBase):
     model_config = ConfigDict(from_attributes=True)
 
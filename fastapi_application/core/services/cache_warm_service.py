@@ -0,0 +1,104 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from itertools import batched
+from uuid import UUID
+
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from fastapi_application.core.cache import cache_route, store_entities
+from fastapi_application.core.config import settings
+from fastapi_application.core.repositories.category_repository import (
+    SQLAlchemyCategoryRepository,
+)
+from fastapi_application.core.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+from fastapi_application.core.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from fastapi_application.core.schemas.category_schema import CategorySchema
+from fastapi_application.core.schemas.product_schema import ProductSchema
+from fastapi_application.core.schemas.user_schema import UserSchema
+
+logger = structlog.get_logger(__name__)
+
+
+class CacheWarmService:
+    """Preloads hot entities into the cache entries of their GET /{id} routes.
+
+    Hot sets are all categories, the products ordered most and the users most
+    recently active within CACHE__WARM_WINDOW_DAYS. Rows are loaded with
+    get_many in batches of CACHE__WARM_BATCH_SIZE, at most
+    CACHE__WARM_CONCURRENCY batches (and DB connections) at a time.
+    """
+
+    def __init__(
+        self,
+        category_repo: SQLAlchemyCategoryRepository,
+        product_repo: SQLAlchemyProductRepository,
+        user_repo: SQLAlchemyUserRepository,
+    ) -> None:
+        self.category_repo = category_repo
+        self.product_repo = product_repo
+        self.user_repo = user_repo
+
+    async def warm(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        logger.info("Warming cache")
+        since = datetime.now(timezone.utc) - timedelta(
+            days=settings.cache.warm_window_days
+        )
+        async with session_factory() as session:
+            category_ids = await self.category_repo.get_ids(
+                session, settings.cache.warm_categories
+            )
+            product_ids = await self.product_repo.get_top_ordered_ids(
+                session, settings.cache.warm_top_products, since
+            )
+            user_ids = await self.user_repo.get_recently_active_ids(
+                session, settings.cache.warm_active_users, since
+            )
+
+        hot_sets = (
+            (self.category_repo, CategorySchema, "category:{}", category_ids),
+            (self.product_repo, ProductSchema, "product:{}", product_ids),
+            (self.user_repo, UserSchema, "user:{}", user_ids),
+        )
+        semaphore = asyncio.Semaphore(settings.cache.warm_concurrency)
+        batches = [
+            (repo, schema, template, ids)
+            for repo, schema, template, obj_ids in hot_sets
+            for ids in batched(obj_ids, settings.cache.warm_batch_size)
+        ]
+        with cache_route("warm", "entity"):
+            await asyncio.gather(
+                *(
+                    self._warm_batch(session_factory, semaphore, *batch)
+                    for batch in batches
+                )
+            )
+
+        logger.info(
+            "Cache warmed",
+            categories=len(category_ids),
+            products=len(product_ids),
+            users=len(user_ids),
+        )
+
+    @staticmethod
+    async def _warm_batch(
+        session_factory: async_sessionmaker[AsyncSession],
+        semaphore: asyncio.Semaphore,
+        repo,
+        schema: type[BaseModel],
+        template: str,
+        obj_ids: tuple[UUID, ...],
+    ) -> None:
+        async with semaphore:
+            async with session_factory() as session:
+                rows = await repo.get_many(session, list(obj_ids), projection=schema)
+            await store_entities(
+                [schema.model_validate(row) for row in rows],
+                template,
+            )
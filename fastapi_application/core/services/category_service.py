@@ -1,15 +1,27 @@
 import structlog
 from uuid import UUID
+from fastapi import HTTPException
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_application.core.cache import invalidate_tags
 from fastapi_application.core.models import Category
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
+from fastapi_application.core.schemas.bulk_schema import BulkUpdateSchema
 from fastapi_application.core.schemas.category_schema import (
     CategoryCreate,
     CategoryUpdate,
     CategoryUpdatePartial,
 )
-from fastapi_application.core.services.utils import handle_integrity_error, get_or_404
+from fastapi_application.core.services.utils import (
+    handle_integrity_error,
+    get_or_404,
+    create_many_isolated,
+    BulkResult,
+    BulkIdsResult,
+)
 from fastapi_application.core.repositories.category_repository import (
     SQLAlchemyCategoryRepository,
 )
@@ -47,6 +59,51 @@ class CategoryService:
         )
         return category
 
+    async def create_many_categories(
+        self,
+        session: AsyncSession,
+        categories_data: list[CategoryCreate],
+    ) -> BulkResult:
+        logger.info("Creating categories in bulk", count=len(categories_data))
+
+        rows = [(index, c.model_dump()) for index, c in enumerate(categories_data)]
+        result = await create_many_isolated(
+            self.category_repo.create_many,
+            session,
+            rows,
+            message="Category with that name already exists",
+        )
+
+        logger.info(
+            "Categories created in bulk",
+            created=len(result.items),
+            failed=len(result.errors),
+        )
+        return result
+
+    async def upsert_category(
+        self,
+        session: AsyncSession,
+        category_name: str,
+    ) -> Category:
+        logger.info("Upserting category", category_name=category_name)
+        result = await self.category_repo.upsert(session, {"name": category_name})
+        category = result.items[0]
+        logger.info("Category upserted", category_id=str(category.id))
+        return category
+
+    async def upsert_many_categories(
+        self,
+        session: AsyncSession,
+        categories_data: list[CategoryCreate],
+    ) -> BulkResult:
+        # one row per name: ON CONFLICT DO UPDATE can't touch a row twice
+        rows = list({c.name: c.model_dump() for c in categories_data}.values())
+        logger.info("Upserting categories in bulk", count=len(rows))
+        categories = (await self.category_repo.upsert_many(session, rows)).items
+        logger.info("Categories upserted in bulk", count=len(categories))
+        return BulkResult(categories, [])
+
     async def get_category(
         self,
         session: AsyncSession,
@@ -63,22 +120,35 @@ class CategoryService:
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Category]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Category] | list[Row]:
         logger.debug("Fetching all categories", limit=limit, offset=offset)
-        categories = await self.category_repo.get_all(session, limit, offset)
+        categories = await self.category_repo.get_all(session, limit, offset, projection)
         logger.debug("Fetched categories", count=len(categories))
         return categories
 
+    async def get_categories_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Category]:
+        logger.debug("Fetching categories by cursor", limit=limit, cursor=cursor)
+        page = await self.category_repo.get_all_by_cursor(session, limit, cursor)
+        logger.debug("Fetched categories by cursor", count=len(page.items))
+        return page
+
     async def get_many_categories(
         self,
         session: AsyncSession,
         category_ids: list[UUID],
-    ) -> list[Category]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Category] | list[Row]:
         logger.debug(
             "Fetching multiple categories",
             category_ids=[str(cid) for cid in category_ids],
         )
-        categories = await self.category_repo.get_many(session, category_ids)
+        categories = await self.category_repo.get_many(session, category_ids, projection)
         logger.debug("Fetched multiple categories", count=len(categories))
         return categories
 
@@ -86,15 +156,25 @@ class CategoryService:
         self,
         session: AsyncSession,
         params: Params | None = None,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Category]:
         logger.debug(
             "Fetching paginated categories",
             params=params.model_dump() if params else None,
         )
-        page = await self.category_repo.get_multi_paginated(session, params=params)
+        page = await self.category_repo.get_multi_paginated(
+            session, params=params, count_strategy=count_strategy
+        )
         logger.debug("Paginated categories fetched", total=len(page.items))
         return page
 
+    async def get_category_version(
+        self,
+        session: AsyncSession,
+        category_id: UUID,
+    ) -> str | None:
+        return await self.category_repo.get_version(session, category_id)
+
     async def update_category_with_partial(
         self,
         session: AsyncSession,
@@ -116,6 +196,7 @@ class CategoryService:
             category_dict,
             message="Category with that name already exists",
         )
+        invalidate_tags(session, f"category:{category.id}")
 
         logger.info(
             "Category updated successfully",
@@ -123,6 +204,33 @@ class CategoryService:
         )
         return updated_category
 
+    async def update_many_categories(
+        self,
+        session: AsyncSession,
+        bulk_upd: BulkUpdateSchema[CategoryUpdatePartial],
+    ) -> BulkIdsResult:
+        values = bulk_upd.values.model_dump(exclude_unset=True)
+        if not values:
+            raise HTTPException(status_code=400, detail="No fields to update")
+
+        logger.info(
+            "Updating categories in bulk",
+            count=len(bulk_upd.ids),
+            fields=list(values),
+        )
+
+        updated_ids = await handle_integrity_error(
+            self.category_repo.update_many,
+            session,
+            bulk_upd.ids,
+            values,
+            message="Category with that name already exists",
+        )
+        invalidate_tags(session, *(f"category:{i}" for i in updated_ids))
+
+        logger.info("Category bulk update finished", updated=len(updated_ids))
+        return BulkIdsResult.from_affected(bulk_upd.ids, updated_ids)
+
     async def delete_category(
         self,
         session: AsyncSession,
@@ -130,8 +238,30 @@ class CategoryService:
     ) -> None:
         logger.warning("Deleting category", category_id=str(category.id))
         await self.category_repo.delete(session, category)
+        invalidate_tags(session, f"category:{category.id}")
         logger.info("Category deleted", category_id=str(category.id))
 
+    async def delete_many_categories(
+        self,
+        session: AsyncSession,
+        category_ids: list[UUID],
+    ) -> BulkIdsResult:
+        logger.warning("Deleting categories in bulk", count=len(category_ids))
+
+        # products of deleted categories stay, uncategorized, like delete_category
+        product_ids = await self.category_repo.uncategorize_products(
+            session, category_ids
+        )
+        deleted_ids = await self.category_repo.delete_many(session, category_ids)
+        invalidate_tags(
+            session,
+            *(f"category:{i}" for i in deleted_ids),
+            *(f"product:{i}" for i in product_ids),
+        )
+
+        logger.info("Category bulk delete finished", deleted=len(deleted_ids))
+        return BulkIdsResult.from_affected(category_ids, deleted_ids)
+
     async def get_category_with_products(
         self,
         session: AsyncSession,
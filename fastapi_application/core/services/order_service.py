@@ -3,9 +3,13 @@ from uuid import UUID
 
 from fastapi import HTTPException
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_application.core.models import Order
+from fastapi_application.core.cache import invalidate_lists, invalidate_tags
+from fastapi_application.core.models import Order, OrderProductAssociation
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
 from fastapi_application.core.schemas.order_schema import (
     OrderCreateWithProducts,
     OrderUpdateWithProducts,
@@ -66,7 +70,7 @@ class OrderService:
         self,
         session: AsyncSession,
         order_data: OrderCreateWithProducts,
-    ) -> Order:
+    ) -> dict:
         user_id = str(order_data.user_id) if order_data.user_id else None
         product_ids = [str(p.product_id) for p in order_data.products]
 
@@ -80,28 +84,28 @@ class OrderService:
 
         try:
             order_dict = order_data.model_dump()
-
-            logger.debug("Fetching product references", product_ids=product_ids)
-            result = await self.product_repo.get_many(
-                session, [item.product_id for item in order_data.products]
-            )
-            products = {p.id: p for p in result}
-
-            logger.debug(
-                "Products fetched",
-                found_count=len(products),
-                requested_count=len(order_data.products),
-            )
-
             order = await self.order_repo.create_order_with_products(
-                session, order_dict, products
+                session, order_dict
             )
+            invalidate_lists(session, Order, OrderProductAssociation)
+
+            found = {line["product"]["id"] for line in order["products_details"]}
+            missing = {p.product_id for p in order_data.products} - found
+            if missing:
+                logger.warning(
+                    "Products not found for order",
+                    product_ids=[str(pid) for pid in missing],
+                )
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Products not found: {', '.join(map(str, missing))}",
+                )
 
             logger.info(
                 "Order with products created successfully",
-                order_id=str(order.id),
+                order_id=str(order["id"]),
                 user_id=user_id,
-                products_count=len(products),
+                products_count=len(order["products_details"]),
             )
             return order
 
@@ -136,26 +140,51 @@ class OrderService:
         limit: int = 50,
         offset: int = 0,
         with_assoc: bool = False,
-    ) -> list[Order]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Order] | list[Row]:
         logger.debug(
             "Fetching all orders", limit=limit, offset=offset, with_assoc=with_assoc
         )
-        orders = await self.order_repo.get_all(session, limit, offset, with_assoc)
+        orders = await self.order_repo.get_all(
+            session, limit, offset, with_assoc, projection
+        )
         logger.debug("Orders fetched", count=len(orders))
         return orders
 
+    async def get_orders_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+        with_assoc: bool = False,
+    ) -> KeysetPage[Order]:
+        logger.debug(
+            "Fetching orders by cursor",
+            limit=limit,
+            cursor=cursor,
+            with_assoc=with_assoc,
+        )
+        page = await self.order_repo.get_all_by_cursor(
+            session, limit, cursor, with_assoc
+        )
+        logger.debug("Orders fetched by cursor", count=len(page.items))
+        return page
+
     async def get_many_orders(
         self,
         session: AsyncSession,
         order_ids: list[UUID],
         with_assoc: bool = False,
-    ) -> list[Order]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Order] | list[Row]:
         logger.debug(
             "Fetching multiple orders",
             order_ids=[str(oid) for oid in order_ids],
             with_assoc=with_assoc,
         )
-        orders = await self.order_repo.get_many(session, order_ids, with_assoc)
+        orders = await self.order_repo.get_many(
+            session, order_ids, with_assoc, projection
+        )
         logger.debug("Fetched multiple orders", count=len(orders))
         return orders
 
@@ -163,14 +192,23 @@ class OrderService:
         self,
         session: AsyncSession,
         params: Params | None = None,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Order]:
         logger.debug(
             "Fetching paginated orders", params=params.model_dump() if params else None
         )
-        page = await self.order_repo.get_multi_paginated(session, params)
+        page = await self.order_repo.get_multi_paginated(
+            session, params, count_strategy
+        )
         logger.debug("Paginated orders fetched", total=len(page.items))
         return page
 
+    async def get_order_version(
+        self,
+        session: AsyncSession,
+        order_id: UUID,
+    ) -> str | None:
+        return await self.order_repo.get_version(session, order_id)
 
     async def update_orders_partial(
         self,
@@ -182,6 +220,7 @@ class OrderService:
         logger.info("Updating order", order_id=str(order.id), partial_update=partial)
         order_dict = order_upd.model_dump(exclude_unset=partial)
         updated = await self.order_repo.update_partial(session, order, order_dict)
+        invalidate_tags(session, f"order:{order.id}")
         logger.info("Order updated successfully", order_id=str(order.id))
         return updated
 
@@ -199,23 +238,25 @@ class OrderService:
         )
 
         data = order_upd.model_dump(exclude_unset=partial)
-        product_ids = [p["product_id"] for p in data.get("products_data", [])]
+        products_data = data.get("products_data") or []
 
-        logger.debug("Fetching related products for update", product_ids=product_ids)
-        result = await self.product_repo.get_many(session, product_ids)
-        products = {p.id: p for p in result}
-        data["products"] = products
-
-        updated_order = await self.order_repo.update_partial_with_products(
-            session,
-            order,
-            data,
-        )
+        try:
+            updated_order = await self.order_repo.update_partial_with_products(
+                session,
+                order,
+                data,
+            )
+        except ValueError as e:
+            logger.warning(
+                "Order update rejected", order_id=str(order.id), error=str(e)
+            )
+            raise HTTPException(status_code=404, detail=str(e))
+        invalidate_tags(session, f"order:{order.id}")
 
         logger.info(
             "Order with products updated successfully",
             order_id=str(order.id),
-            updated_products=len(products),
+            updated_products=len(products_data),
         )
         return updated_order
 
@@ -227,4 +268,5 @@ class OrderService:
     ) -> None:
         logger.warning("Deleting order", order_id=str(order.id))
         await self.order_repo.delete(session, order)
+        invalidate_tags(session, f"order:{order.id}")
         logger.info("Order deleted successfully", order_id=str(order.id))
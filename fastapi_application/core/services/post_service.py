@@ -1,11 +1,23 @@
 import structlog
 from uuid import UUID
 
+from fastapi import HTTPException
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_application.core.services.utils import get_or_404
+from fastapi_application.core.cache import invalidate_tags
+from fastapi_application.core.services.utils import (
+    get_or_404,
+    create_many_isolated,
+    handle_integrity_error,
+    BulkResult,
+    BulkIdsResult,
+)
 from fastapi_application.core.models import Post
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
+from fastapi_application.core.schemas.bulk_schema import BulkUpdateSchema
 from fastapi_application.core.schemas.post_schema import (
     PostCreate,
     PostUpdate,
@@ -58,6 +70,31 @@ class PostService:
             )
             raise
 
+    async def create_many_posts(
+        self,
+        session: AsyncSession,
+        posts_data: list[PostCreate],
+    ) -> BulkResult:
+        logger.info("Creating posts in bulk", count=len(posts_data))
+
+        rows = [(index, p.model_dump()) for index, p in enumerate(posts_data)]
+        result = await create_many_isolated(
+            self.post_repo.create_many,
+            session,
+            rows,
+            message="Post violates database constraints",
+            constraint_messages={
+                "posts_user_id_fkey": "Post references a user that does not exist",
+            },
+        )
+
+        logger.info(
+            "Posts created in bulk",
+            created=len(result.items),
+            failed=len(result.errors),
+        )
+        return result
+
     async def get_post(
         self,
         session: AsyncSession,
@@ -78,10 +115,11 @@ class PostService:
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Post]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Post] | list[Row]:
         logger.info("Retrieving all posts", limit=limit, offset=offset)
 
-        posts = await self.post_repo.get_all(session, limit, offset)
+        posts = await self.post_repo.get_all(session, limit, offset, projection)
 
         logger.info(
             "Posts retrieved successfully",
@@ -91,17 +129,35 @@ class PostService:
         )
         return posts
 
+    async def get_posts_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Post]:
+        logger.info("Retrieving posts by cursor", limit=limit, cursor=cursor)
+
+        page = await self.post_repo.get_all_by_cursor(session, limit, cursor)
+
+        logger.info(
+            "Posts retrieved successfully by cursor",
+            count=len(page.items),
+            has_next=page.next_cursor is not None,
+        )
+        return page
+
     async def get_many_posts(
         self,
         session: AsyncSession,
         post_ids: list[UUID],
-    ) -> list[Post]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Post] | list[Row]:
         logger.info(
             "Retrieving multiple posts",
             post_ids=[str(pid) for pid in post_ids],
         )
 
-        posts = await self.post_repo.get_many(session, post_ids)
+        posts = await self.post_repo.get_many(session, post_ids, projection)
 
         logger.info(
             "Multiple posts retrieved successfully",
@@ -113,12 +169,22 @@ class PostService:
         self,
         session: AsyncSession,
         params: Params | None = None,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Post]:
         logger.info("Retrieving paginated posts")
-        page = await self.post_repo.get_multi_paginated(session, params=params)
+        page = await self.post_repo.get_multi_paginated(
+            session, params=params, count_strategy=count_strategy
+        )
         logger.info("Paginated posts retrieved", total_items=page.total)
         return page
 
+    async def get_post_version(
+        self,
+        session: AsyncSession,
+        post_id: UUID,
+    ) -> str | None:
+        return await self.post_repo.get_version(session, post_id)
+
     async def update_post_with_partial(
         self,
         session: AsyncSession,
@@ -134,6 +200,7 @@ class PostService:
 
         post_dict = post_upd.model_dump(exclude_unset=partial)
         updated_post = await self.post_repo.update_partial(session, post, post_dict)
+        invalidate_tags(session, f"post:{post.id}")
 
         logger.info(
             "Post updated successfully",
@@ -142,6 +209,33 @@ class PostService:
         )
         return updated_post
 
+    async def update_many_posts(
+        self,
+        session: AsyncSession,
+        bulk_upd: BulkUpdateSchema[PostUpdatePartial],
+    ) -> BulkIdsResult:
+        values = bulk_upd.values.model_dump(exclude_unset=True)
+        if not values:
+            raise HTTPException(status_code=400, detail="No fields to update")
+
+        logger.info(
+            "Updating posts in bulk",
+            count=len(bulk_upd.ids),
+            fields=list(values),
+        )
+
+        updated_ids = await handle_integrity_error(
+            self.post_repo.update_many,
+            session,
+            bulk_upd.ids,
+            values,
+            message="Post references a user that does not exist",
+        )
+        invalidate_tags(session, *(f"post:{i}" for i in updated_ids))
+
+        logger.info("Post bulk update finished", updated=len(updated_ids))
+        return BulkIdsResult.from_affected(bulk_upd.ids, updated_ids)
+
     async def delete_post(
         self,
         session: AsyncSession,
@@ -150,5 +244,19 @@ class PostService:
         logger.info("Deleting post", post_id=str(post.id))
 
         await self.post_repo.delete(session, post)
+        invalidate_tags(session, f"post:{post.id}")
 
         logger.info("Post deleted successfully", post_id=str(post.id))
+
+    async def delete_many_posts(
+        self,
+        session: AsyncSession,
+        post_ids: list[UUID],
+    ) -> BulkIdsResult:
+        logger.warning("Deleting posts in bulk", count=len(post_ids))
+
+        deleted_ids = await self.post_repo.delete_many(session, post_ids)
+        invalidate_tags(session, *(f"post:{i}" for i in deleted_ids))
+
+        logger.info("Post bulk delete finished", deleted=len(deleted_ids))
+        return BulkIdsResult.from_affected(post_ids, deleted_ids)
@@ -1,15 +1,29 @@
 import structlog
 from uuid import UUID
 
+from fastapi import HTTPException
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_application.core.services.utils import get_or_404
+from fastapi_application.core.cache import invalidate_tags
+from fastapi_application.core.services.utils import (
+    get_or_404,
+    create_many_isolated,
+    handle_integrity_error,
+    BulkResult,
+    BulkIdsResult,
+    BulkItemError,
+)
 from fastapi_application.core.models import Product
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
+from fastapi_application.core.schemas.bulk_schema import BulkUpdateSchema
 from fastapi_application.core.schemas.product_schema import (
     ProductCreate,
     ProductUpdate,
     ProductUpdatePartial,
+    ProductUpsert,
 )
 from fastapi_application.core.repositories.category_repository import (
     SQLAlchemyCategoryRepository,
@@ -21,6 +35,31 @@ from fastapi_application.core.repositories import (
 logger = structlog.get_logger()
 
 
+def _invalidate_products(
+    session: AsyncSession,
+    product_ids: list[UUID],
+    category_ids: list[UUID | None] | None = None,
+) -> None:
+    """Evict cached products and the categories listing them.
+
+    Without category_ids every category-with-products entry is evicted.
+    """
+    tags = [f"product:{product_id}" for product_id in product_ids]
+    if category_ids is None:
+        tags.append("category_products")
+    else:
+        tags.extend(_category_products_tags(category_ids))
+    invalidate_tags(session, *tags)
+
+
+def _category_products_tags(category_ids: list[UUID | None]) -> list[str]:
+    return [
+        f"category_products:{category_id}"
+        for category_id in dict.fromkeys(category_ids)
+        if category_id is not None
+    ]
+
+
 class ProductService:
     def __init__(
         self,
@@ -68,6 +107,8 @@ class ProductService:
                     "category_id": category_id,
                 },
             )
+            # a new id has nothing cached; only its category's list changes
+            invalidate_tags(session, *_category_products_tags([category_id]))
 
             logger.info(
                 "Product created successfully",
@@ -88,6 +129,129 @@ class ProductService:
             )
             raise
 
+    async def _product_rows(
+        self,
+        session: AsyncSession,
+        products_data: list[ProductCreate],
+    ) -> tuple[list[tuple[int, dict]], list[BulkItemError]]:
+        category_names = {
+            p.category_name for p in products_data if p.category_name is not None
+        }
+        categories = await self.category_repo.get_by_names(
+            session, list(category_names)
+        )
+        category_ids = {c.name: c.id for c in categories}
+
+        rows, errors = [], []
+        for index, product_data in enumerate(products_data):
+            category_id: UUID | None = None
+            if product_data.category_name is not None:
+                category_id = category_ids.get(product_data.category_name)
+                if category_id is None:
+                    errors.append(BulkItemError(index, "Category not found"))
+                    continue
+            rows.append(
+                (
+                    index,
+                    {
+                        "name": product_data.name,
+                        "price": product_data.price,
+                        "description": product_data.description,
+                        "category_id": category_id,
+                    },
+                )
+            )
+        return rows, errors
+
+    async def create_many_products(
+        self,
+        session: AsyncSession,
+        products_data: list[ProductCreate],
+    ) -> BulkResult:
+        logger.info("Creating products in bulk", count=len(products_data))
+
+        if session.in_transaction():
+            rows, errors = await self._product_rows(session, products_data)
+        else:
+            # close the lookup's transaction: the insert then needs no savepoint
+            async with session.begin():
+                rows, errors = await self._product_rows(session, products_data)
+        result = await create_many_isolated(
+            self.product_repo.create_many,
+            session,
+            rows,
+            message="Product violates database constraints",
+        )
+        errors = sorted(errors + result.errors)
+        invalidate_tags(
+            session,
+            *_category_products_tags([product.category_id for product in result.items]),
+        )
+
+        logger.info(
+            "Products created in bulk",
+            created=len(result.items),
+            failed=len(errors),
+        )
+        return BulkResult(result.items, errors)
+
+    async def upsert_product(
+        self,
+        session: AsyncSession,
+        product_name: str,
+        product_upd: ProductUpsert,
+    ) -> Product:
+        logger.info("Upserting product", name=product_name)
+
+        category_id: UUID | None = None
+        if product_upd.category_name is not None:
+            category = await self.category_repo.get_by_name(
+                session, product_upd.category_name
+            )
+            get_or_404(category)
+            category_id = category.id
+
+        result = await self.product_repo.upsert(
+            session,
+            {
+                "name": product_name,
+                "price": product_upd.price,
+                "description": product_upd.description,
+                "category_id": category_id,
+            },
+        )
+        product = result.items[0]
+        # an idempotent PUT leaves the row, and so the caches, untouched
+        if result.changed:
+            _invalidate_products(session, [product.id])
+
+        logger.info("Product upserted", product_id=str(product.id))
+        return product
+
+    async def upsert_many_products(
+        self,
+        session: AsyncSession,
+        products_data: list[ProductCreate],
+    ) -> BulkResult:
+        logger.info("Upserting products in bulk", count=len(products_data))
+
+        rows, errors = await self._product_rows(session, products_data)
+        # one row per name: ON CONFLICT DO UPDATE can't touch a row twice
+        rows_by_name = {data["name"]: data for _, data in rows}
+        result = await self.product_repo.upsert_many(
+            session, list(rows_by_name.values())
+        )
+        products = result.items
+        if result.changed:
+            _invalidate_products(session, [product.id for product in result.changed])
+
+        logger.info(
+            "Products upserted in bulk",
+            upserted=len(products),
+            failed=len(errors),
+        )
+        return BulkResult(products, errors)
+
     async def get_product(
         self,
         session: AsyncSession,
@@ -108,10 +272,11 @@ class ProductService:
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[Product]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Product] | list[Row]:
         logger.info("Retrieving all products", limit=limit, offset=offset)
 
-        products = await self.product_repo.get_all(session, limit, offset)
+        products = await self.product_repo.get_all(session, limit, offset, projection)
 
         logger.info(
             "Products retrieved successfully",
@@ -121,17 +286,35 @@ class ProductService:
         )
         return products
 
+    async def get_products_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[Product]:
+        logger.info("Retrieving products by cursor", limit=limit, cursor=cursor)
+
+        page = await self.product_repo.get_all_by_cursor(session, limit, cursor)
+
+        logger.info(
+            "Products retrieved successfully by cursor",
+            count=len(page.items),
+            has_next=page.next_cursor is not None,
+        )
+        return page
+
     async def get_many_products(
         self,
         session: AsyncSession,
         product_ids: list[UUID],
-    ) -> list[Product]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[Product] | list[Row]:
         logger.info(
             "Retrieving multiple products",
             product_ids=[str(pid) for pid in product_ids],
         )
 
-        products = await self.product_repo.get_many(session, product_ids)
+        products = await self.product_repo.get_many(session, product_ids, projection)
 
         logger.info(
             "Multiple products retrieved successfully",
@@ -143,14 +326,24 @@ class ProductService:
         self,
         session: AsyncSession,
         params: Params | None = None,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[Product]:
         logger.info("Retrieving paginated products")
 
-        page = await self.product_repo.get_multi_paginated(session, params=params)
+        page = await self.product_repo.get_multi_paginated(
+            session, params=params, count_strategy=count_strategy
+        )
 
         logger.info("Paginated products retrieved", total_items=page.total)
         return page
 
+    async def get_product_version(
+        self,
+        session: AsyncSession,
+        product_id: UUID,
+    ) -> str | None:
+        return await self.product_repo.get_version(session, product_id)
+
     async def update_product_with_partial(
         self,
         session: AsyncSession,
@@ -186,12 +379,18 @@ class ProductService:
 
             product_dict["category_id"] = category_id
             product_dict.pop("category_name", None)
+            old_category_id = product.category_id
 
             updated_product = await self.product_repo.update_partial(
                 session,
                 product,
                 product_dict,
             )
+            _invalidate_products(
+                session,
+                [updated_product.id],
+                [old_category_id, updated_product.category_id],
+            )
 
             logger.info(
                 "Product updated successfully",
@@ -209,6 +408,42 @@ class ProductService:
             )
             raise
 
+    async def update_many_products(
+        self,
+        session: AsyncSession,
+        bulk_upd: BulkUpdateSchema[ProductUpdatePartial],
+    ) -> BulkIdsResult:
+        values = bulk_upd.values.model_dump(exclude_unset=True)
+        if not values:
+            raise HTTPException(status_code=400, detail="No fields to update")
+
+        logger.info(
+            "Updating products in bulk",
+            count=len(bulk_upd.ids),
+            fields=list(values),
+        )
+
+        if "category_name" in values:
+            category_name = values.pop("category_name")
+            category_id: UUID | None = None
+            if category_name is not None:
+                category = await self.category_repo.get_by_name(session, category_name)
+                get_or_404(category)
+                category_id = category.id
+            values["category_id"] = category_id
+
+        updated_ids = await handle_integrity_error(
+            self.product_repo.update_many,
+            session,
+            bulk_upd.ids,
+            values,
+            message="Product violates database constraints",
+        )
+        _invalidate_products(session, updated_ids)
+
+        logger.info("Product bulk update finished", updated=len(updated_ids))
+        return BulkIdsResult.from_affected(bulk_upd.ids, updated_ids)
+
     async def delete_product(
         self,
         session: AsyncSession,
@@ -217,5 +452,19 @@ class ProductService:
         logger.info("Deleting product", product_id=str(product.id))
 
         await self.product_repo.delete(session, product)
+        _invalidate_products(session, [product.id], [product.category_id])
 
         logger.info("Product deleted successfully", product_id=str(product.id))
+
+    async def delete_many_products(
+        self,
+        session: AsyncSession,
+        product_ids: list[UUID],
+    ) -> BulkIdsResult:
+        logger.warning("Deleting products in bulk", count=len(product_ids))
+
+        deleted_ids = await self.product_repo.delete_many(session, product_ids)
+        _invalidate_products(session, deleted_ids)
+
+        logger.info("Product bulk delete finished", deleted=len(deleted_ids))
+        return BulkIdsResult.from_affected(product_ids, deleted_ids)
@@ -2,9 +2,17 @@ from uuid import UUID
 
 import structlog
 from fastapi_pagination import Params, Page
+from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_application.core.cache import (
+    forget_missing,
+    invalidate_tags,
+    revoke_user_tokens,
+)
 from fastapi_application.core.models import User
+from fastapi_application.core.repositories.utils import KeysetPage, CountStrategy
 from fastapi_application.core.schemas.user_schema import (
     UserCreate,
     UserUpdate,
@@ -18,6 +26,19 @@ from fastapi_application.core.repositories import (
 logger = structlog.get_logger()
 
 
+def _forget_missing_user(session: AsyncSession, user: User) -> None:
+    forget_missing(session, User, "username", user.username)
+    forget_missing(session, User, "email", user.email)
+
+
+def _user_tags(user: User) -> tuple[str, ...]:
+    return (
+        f"user:{user.id}",
+        f"user:username:{user.username}",
+        f"user:email:{user.email}",
+    )
+
+
 class UserService:
     def __init__(
         self,
@@ -45,6 +66,7 @@ class UserService:
                 user_dict,
                 message="User with that email or username already exists",
             )
+            _forget_missing_user(session, user)
 
             logger.info(
                 "User created successfully",
@@ -84,10 +106,11 @@ class UserService:
         session: AsyncSession,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[User]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[User] | list[Row]:
         logger.info("Retrieving all users", limit=limit, offset=offset)
 
-        users = await self.user_repo.get_all(session, limit, offset)
+        users = await self.user_repo.get_all(session, limit, offset, projection)
 
         logger.info(
             "Users retrieved successfully",
@@ -97,17 +120,35 @@ class UserService:
         )
         return users
 
+    async def get_users_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> KeysetPage[User]:
+        logger.info("Retrieving users by cursor", limit=limit, cursor=cursor)
+
+        page = await self.user_repo.get_all_by_cursor(session, limit, cursor)
+
+        logger.info(
+            "Users retrieved successfully by cursor",
+            count=len(page.items),
+            has_next=page.next_cursor is not None,
+        )
+        return page
+
     async def get_many_users(
         self,
         session: AsyncSession,
         user_ids: list[UUID],
-    ) -> list[User]:
+        projection: type[BaseModel] | None = None,
+    ) -> list[User] | list[Row]:
         logger.info(
             "Retrieving multiple users",
             user_ids=[str(uid) for uid in user_ids],
         )
 
-        users = await self.user_repo.get_many(session, user_ids)
+        users = await self.user_repo.get_many(session, user_ids, projection)
 
         logger.info(
             "Multiple users retrieved successfully",
@@ -119,14 +160,24 @@ class UserService:
         self,
         session: AsyncSession,
         params: Params | None = None,
+        count_strategy: CountStrategy | None = None,
     ) -> Page[User]:
         logger.info("Retrieving paginated users")
 
-        page = await self.user_repo.get_multi_paginated(session, params=params)
+        page = await self.user_repo.get_multi_paginated(
+            session, params=params, count_strategy=count_strategy
+        )
 
         logger.info("Paginated users retrieved", total_items=page.total)
         return page
 
+    async def get_user_version(
+        self,
+        session: AsyncSession,
+        user_id: UUID,
+    ) -> str | None:
+        return await self.user_repo.get_version(session, user_id)
+
     async def update_user_with_partial(
         self,
         session: AsyncSession,
@@ -142,7 +193,11 @@ class UserService:
 
         try:
             user_dict = user_upd.model_dump(exclude_unset=partial)
+            invalidate_tags(session, *_user_tags(user))
+            revoke_user_tokens(session, user.id)
             updated_user = await self.user_repo.update_partial(session, user, user_dict)
+            # a renamed user now answers to a username/email that used to miss
+            _forget_missing_user(session, updated_user)
 
             logger.info(
                 "User updated successfully",
@@ -168,6 +223,8 @@ class UserService:
         logger.info("Deleting user", user_id=str(user.id))
 
         await self.user_repo.delete(session, user)
+        invalidate_tags(session, *_user_tags(user))
+        revoke_user_tokens(session, user.id)
 
         logger.info("User deleted successfully", user_id=str(user.id))
 
@@ -217,6 +274,19 @@ class UserService:
         )
         return users
 
+    async def get_users_with_orders_json(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> str:
+        logger.info("Building users with orders JSON", limit=limit, offset=offset)
+
+        document = await self.user_repo.get_with_orders_json(session, limit, offset)
+
+        logger.info("Users with orders JSON built", size=len(document))
+        return document
+
     async def get_users_with_posts(
         self,
         session: AsyncSession,
@@ -251,6 +321,21 @@ class UserService:
         )
         return users
 
+    async def get_many_users_with_orders_json(
+        self,
+        session: AsyncSession,
+        user_ids: list[UUID],
+    ) -> str:
+        logger.info(
+            "Building many users with orders JSON",
+            user_ids=[str(uid) for uid in user_ids],
+        )
+
+        document = await self.user_repo.get_many_with_orders_json(session, user_ids)
+
+        logger.info("Many users with orders JSON built", size=len(document))
+        return document
+
     async def get_many_users_with_posts(
         self,
         session: AsyncSession,
@@ -1,8 +1,39 @@
+from contextlib import nullcontext
+from typing import NamedTuple, Any
+from uuid import UUID
+
 import sqlalchemy.exc
+import structlog
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_application.core.repositories.base_repository import ModelT
 
+logger = structlog.get_logger(__name__)
+
+
+class BulkItemError(NamedTuple):
+    index: int
+    error: str
+
+
+class BulkResult(NamedTuple):
+    items: list[Any]
+    errors: list[BulkItemError]
+
+
+class BulkIdsResult(NamedTuple):
+    ids: list[UUID]
+    not_found: list[UUID]
+
+    @classmethod
+    def from_affected(cls, requested: list[UUID], affected: list[UUID]):
+        affected_ids = set(affected)
+        return cls(
+            affected,
+            [i for i in dict.fromkeys(requested) if i not in affected_ids],
+        )
+
 
 async def handle_integrity_error(
     func, *args, message="Object already exists", **kwargs
@@ -13,6 +44,49 @@ async def handle_integrity_error(
         raise HTTPException(status_code=400, detail=message)
 
 
+def constraint_name(error: sqlalchemy.exc.IntegrityError) -> str | None:
+    # asyncpg's exception is chained under the DBAPI adapter's
+    return getattr(error.orig.__cause__, "constraint_name", None)
+
+
+async def create_many_isolated(
+    create_many,
+    session: AsyncSession,
+    rows: list[tuple[int, dict]],
+    message="Object violates database constraints",
+    constraint_messages: dict[str, str] | None = None,
+) -> BulkResult:
+    """Insert rows in one statement; on a constraint violation, retry them
+    one by one inside savepoints so only the offending items are rejected.
+
+    Without an open transaction the batch runs in a transaction of its own
+    and the retry in a fresh one, so the common case costs no savepoints.
+    Item errors use constraint_messages[<violated constraint>], else message.
+    """
+    if not rows:
+        return BulkResult([], [])
+
+    owns_transaction = not session.in_transaction()
+    try:
+        async with session.begin() if owns_transaction else session.begin_nested():
+            items = await create_many(session, [data for _, data in rows])
+        return BulkResult(items, [])
+    except sqlalchemy.exc.IntegrityError:
+        logger.warning("Bulk insert rejected, isolating rows", rows=len(rows))
+
+    constraint_messages = constraint_messages or {}
+    items, errors = [], []
+    async with session.begin() if owns_transaction else nullcontext():
+        for index, data in rows:
+            try:
+                async with session.begin_nested():
+                    items.extend(await create_many(session, [data]))
+            except sqlalchemy.exc.IntegrityError as e:
+                error = constraint_messages.get(constraint_name(e), message)
+                errors.append(BulkItemError(index, error))
+    return BulkResult(items, errors)
+
+
 def get_or_404(
     obj: ModelT,
 ) -> None:
@@ -1,28 +1,75 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 from fastapi_limiter import FastAPILimiter
 
-from core.db import dispose
+from core.db import dispose, async_session
 from error_handlers import register_errors_handlers
 from middleware import CorrelationIdMiddleware
-from redis_conf.redis import set_async_redis_client
+from fastapi_application.core.cache import (
+    ResponseBytesCoder,
+    TwoTierBackend,
+    create_cache_backend,
+)
+from fastapi_application.core.config import settings
+from fastapi_application.core.repositories.category_repository import (
+    SQLAlchemyCategoryRepository,
+)
+from fastapi_application.core.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+from fastapi_application.core.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from fastapi_application.core.services.cache_warm_service import CacheWarmService
+from redis_conf.redis import AsyncRedisClient, set_async_redis_client
 
 logger = structlog.get_logger()
 
+cache_warm_service = CacheWarmService(
+    category_repo=SQLAlchemyCategoryRepository(),
+    product_repo=SQLAlchemyProductRepository(),
+    user_repo=SQLAlchemyUserRepository(),
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Application started")
     redis_client = await set_async_redis_client()
-    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
+    cache_backend = create_cache_backend(await AsyncRedisClient.get_binary_client())
+    FastAPICache.init(
+        cache_backend,
+        prefix=settings.cache.prefix,
+        coder=ResponseBytesCoder,
+    )
+    invalidation_listener = None
+    if isinstance(cache_backend, TwoTierBackend):
+        invalidation_listener = asyncio.create_task(
+            cache_backend.listen_invalidations()
+        )
     await FastAPILimiter.init(redis_client)
+    tracking = AsyncRedisClient.start_tracking()
+    if settings.cache.warm_enabled:
+        try:
+            await asyncio.wait_for(
+                cache_warm_service.warm(async_session),
+                settings.cache.warm_timeout,
+            )
+        except Exception as e:
+            # a cold cache is slower, not broken: start serving anyway
+            logger.warning("Cache warm-up failed", error=repr(e))
     yield
+    for task in (invalidation_listener, tracking):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
     await dispose()
     logger.info("Application stopped")
 
@@ -0,0 +1,116 @@
+import asyncio
+from typing import Any
+
+from fastapi_application.core.config import settings
+from redis_conf.circuit_breaker import BreakerRedis
+
+# commands that block or change connection state can't share a pipeline
+UNPIPELINED = frozenset(
+    {
+        "BLPOP",
+        "BRPOP",
+        "BLMOVE",
+        "BRPOPLPUSH",
+        "BZPOPMIN",
+        "BZPOPMAX",
+        "XREAD",
+        "XREADGROUP",
+        "WAIT",
+        "WATCH",
+        "UNWATCH",
+        "MULTI",
+        "EXEC",
+        "DISCARD",
+        "SELECT",
+        "CLIENT",
+        "MONITOR",
+        "SUBSCRIBE",
+        "PSUBSCRIBE",
+    }
+)
+
+
+class AutoPipelineRedis(BreakerRedis):
+    """BreakerRedis that coalesces concurrent commands into pipelines.
+
+    Commands issued by different coroutines are queued and sent together as
+    one non-transactional pipeline: on the next loop iteration, or after
+    REDIS__PIPELINE_WINDOW seconds when set, or as soon as
+    REDIS__PIPELINE_MAX_BATCH commands are waiting. Each caller still gets its
+    own result or exception; explicit pipelines, pub/sub and blocking or
+    connection-state commands bypass the queue.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pipeline_window = settings.redis.pipeline_window
+        self.pipeline_max_batch = settings.redis.pipeline_max_batch
+        self._queue: list[tuple[tuple, dict, asyncio.Future]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def execute_command(self, *args, **options) -> Any:
+        if str(args[0]).upper() in UNPIPELINED:
+            return await super().execute_command(*args, **options)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((args, options, future))
+        if len(self._queue) >= self.pipeline_max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.pipeline_window > 0:
+                self._flush_handle = loop.call_later(self.pipeline_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._queue = self._queue, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _send(self, batch: list[tuple[tuple, dict, asyncio.Future]]) -> None:
+        if len(batch) == 1:
+            args, options, future = batch[0]
+            try:
+                result = await super().execute_command(*args, **options)
+            except Exception as e:
+                _resolve(future, error=e)
+            else:
+                _resolve(future, result)
+            return
+
+        pipe = self.pipeline(transaction=False)
+        for args, options, _ in batch:
+            pipe.execute_command(*args, **options)
+        try:
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            for *_, future in batch:
+                _resolve(future, error=e)
+            return
+
+        for (*_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                _resolve(future, error=result)
+            else:
+                _resolve(future, result)
+
+
+def _resolve(
+    future: asyncio.Future, result: Any = None, error: Exception | None = None
+) -> None:
+    # the caller may have been cancelled while its command was in flight
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from prometheus_client import Counter, Gauge
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError, TimeoutError
+
+from fastapi_application.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+CIRCUIT_STATE = Gauge(
+    "redis_circuit_state",
+    "Redis circuit breaker state: 0 closed, 1 half-open, 2 open.",
+)
+CIRCUIT_TRANSITIONS = Counter(
+    "redis_circuit_transitions_total",
+    "Redis circuit breaker state changes, by new state.",
+    ["state"],
+)
+CIRCUIT_REJECTED = Counter(
+    "redis_circuit_rejected_total",
+    "Redis calls failed fast while the circuit was not closed.",
+)
+
+# errors that mean Redis is unreachable or slow, as opposed to a bad command
+FAILURES = (ConnectionError, TimeoutError, asyncio.TimeoutError, OSError)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling Redis while the circuit is open.
+
+    A ConnectionError, so callers that already tolerate an unreachable Redis
+    (cache, rate limiter) fail open without special-casing the breaker.
+    """
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker shared by the Redis clients.
+
+    Calls and failures are counted in one-second buckets over `window`
+    seconds; once at least `min_calls` were made and the failure share reaches
+    `failure_rate`, the circuit opens and every call fails fast. While open, a
+    background task pings Redis every `probe_interval` seconds (half-open
+    while the ping is in flight) and closes the circuit on the first success.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float,
+        min_calls: int,
+        window: int,
+        probe_interval: float,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.probe_interval = probe_interval
+        self.state = CLOSED
+        # [second, calls, failures]
+        self._buckets: deque[list[int]] = deque()
+        self._probe_task: asyncio.Task | None = None
+
+    async def call(
+        self,
+        client: Redis,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        **kwargs,
+    ) -> Any:
+        if self.state != CLOSED:
+            CIRCUIT_REJECTED.inc()
+            raise CircuitOpenError("Redis circuit is open")
+        try:
+            result = await func(*args, **kwargs)
+        except FAILURES:
+            self._record(client, failed=True)
+            raise
+        self._record(client, failed=False)
+        return result
+
+    def _record(self, client: Redis, failed: bool) -> None:
+        if self.state != CLOSED:
+            return
+        now = int(time.monotonic())
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        while self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+        self._buckets[-1][1] += 1
+        self._buckets[-1][2] += failed
+        if not failed:
+            return
+
+        calls = sum(bucket[1] for bucket in self._buckets)
+        failures = sum(bucket[2] for bucket in self._buckets)
+        if calls >= self.min_calls and failures >= calls * self.failure_rate:
+            logger.warning(
+                "Redis circuit opened after %s failures in %s calls", failures, calls
+            )
+            self._set_state(OPEN)
+            self._probe_task = asyncio.create_task(self._run_probes(client))
+
+    async def _run_probes(self, client: Redis) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            self._set_state(HALF_OPEN)
+            try:
+                # straight to the connection, past this breaker
+                await Redis.execute_command(client, "PING")
+            except Exception as e:
+                logger.debug("Redis probe failed: %s", e)
+                self._set_state(OPEN)
+                continue
+            logger.info("Redis circuit closed")
+            self._buckets.clear()
+            self._set_state(CLOSED)
+            return
+
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        CIRCUIT_STATE.set((CLOSED, HALF_OPEN, OPEN).index(state))
+        CIRCUIT_TRANSITIONS.labels(state).inc()
+
+
+redis_breaker = CircuitBreaker(
+    failure_rate=settings.redis.breaker_failure_rate,
+    min_calls=settings.redis.breaker_min_calls,
+    window=settings.redis.breaker_window,
+    probe_interval=settings.redis.breaker_probe_interval,
+)
+
+
+class BreakerRedis(Redis):
+    """Redis client whose commands and pipelines go through redis_breaker."""
+
+    async def execute_command(self, *args, **options):
+        return await redis_breaker.call(
+            self, super().execute_command, *args, **options
+        )
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: str | None = None
+    ) -> Pipeline:
+        pipe = BreakerPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipe.breaker_client = self
+        return pipe
+
+
+class BreakerPipeline(Pipeline):
+    breaker_client: Redis
+
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        return await redis_breaker.call(
+            self.breaker_client, super().execute, raise_on_error
+        )
@@ -1,27 +1,37 @@
+import asyncio
 import logging
+from typing import Any
 
-import redis.asyncio as aioredis
 from redis.asyncio import Redis
 
 from fastapi_application.core.config import settings
+from redis_conf.auto_pipeline import AutoPipelineRedis
+from redis_conf.circuit_breaker import BreakerRedis
+from redis_conf.tracking import TrackingCache
 
 logger = logging.getLogger(__name__)
 
+redis_class = AutoPipelineRedis if settings.redis.auto_pipeline else BreakerRedis
+
 
 class AsyncRedisClient:
     _client: Redis = None
+    # separate pool without decode_responses for binary payloads (response cache)
+    _binary_client: Redis = None
+    # per-worker copies of hot keys, when REDIS__TRACKING_ENABLED
+    _tracking: TrackingCache = None
 
     @classmethod
     async def initialize(cls):
 
         if cls._client is None:
-            cls._client = await aioredis.from_url(
+            cls._client = await redis_class.from_url(
                 f"redis://:{settings.redis.password}@{settings.redis.host}:{settings.redis.port}",
-                max_connections=20,
+                max_connections=settings.redis.max_connections,
                 encoding="utf8",
                 decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
+                socket_connect_timeout=settings.redis.connect_timeout,
+                socket_timeout=settings.redis.socket_timeout,
             )
         return cls._client
 
@@ -31,6 +41,54 @@ class AsyncRedisClient:
             await cls.initialize()
         return cls._client
 
+    @classmethod
+    async def get_binary_client(cls):
+        if cls._binary_client is None:
+            cls._binary_client = await redis_class.from_url(
+                f"redis://:{settings.redis.password}@{settings.redis.host}:{settings.redis.port}",
+                max_connections=settings.redis.max_connections,
+                decode_responses=False,
+                socket_connect_timeout=settings.redis.connect_timeout,
+                socket_timeout=settings.redis.socket_timeout,
+            )
+        return cls._binary_client
+
+    @classmethod
+    def start_tracking(cls) -> asyncio.Task | None:
+        if not settings.redis.tracking_enabled:
+            return None
+        prefixes = settings.redis.tracking_prefixes
+        if prefixes is None:
+            prefixes = ["cache-version:", "count:", f"{settings.cache.prefix}:etag:"]
+        cls._tracking = TrackingCache(
+            prefixes=prefixes,
+            max_entries=settings.redis.tracking_max_entries,
+            ttl=settings.redis.tracking_ttl,
+        )
+        return asyncio.create_task(
+            cls._tracking.run(
+                host=settings.redis.host,
+                port=int(settings.redis.port),
+                password=settings.redis.password or None,
+                socket_connect_timeout=settings.redis.connect_timeout,
+            )
+        )
+
+    @classmethod
+    async def get_tracked(cls, key: str) -> Any:
+        """GET, served from this worker's copy if the key is tracked."""
+        client = await cls.get_client()
+        if cls._tracking is None:
+            return await client.get(key)
+        return await cls._tracking.get(client, key)
+
+    @classmethod
+    async def mget_tracked(cls, keys: list[str]) -> list[Any]:
+        client = await cls.get_client()
+        if cls._tracking is None:
+            return await client.mget(keys)
+        return await cls._tracking.mget(client, keys)
+
 
 async def set_async_redis_client() -> Redis:
     client = await AsyncRedisClient.initialize()
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis._parsers import _AsyncRESP3Parser
+from redis.asyncio import Redis
+from redis.asyncio.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TrackingCache:
+    """Process-local copies of hot Redis keys, invalidated by the server.
+
+    A dedicated RESP3 connection runs CLIENT TRACKING in BCAST mode for
+    `prefixes`, so Redis pushes an invalidation for every write to a matching
+    key, whoever makes it. get()/mget() of matching keys are then answered
+    locally after the first read. A value is not stored if any invalidation
+    arrived while it was being read, entries also expire after `ttl` seconds,
+    and the copies are dropped and bypassed while the connection is down.
+    Needs Redis 6+.
+    """
+
+    def __init__(self, prefixes: list[str], max_entries: int, ttl: float) -> None:
+        self.prefixes = tuple(prefixes)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.active = False
+        # key -> (deadline, value); None values cache missing keys
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # bumped by every invalidation; reads that straddle one aren't stored
+        self._epoch = 0
+
+    def tracks(self, key: str) -> bool:
+        return self.active and key.startswith(self.prefixes)
+
+    async def get(self, client: Redis, key: str) -> Any:
+        if not self.tracks(key):
+            return await client.get(key)
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        epoch = self._epoch
+        value = await client.get(key)
+        self._store(key, value, epoch)
+        return value
+
+    async def mget(self, client: Redis, keys: list[str]) -> list[Any]:
+        values = [
+            self._lookup(key) if self.tracks(key) else _MISSING for key in keys
+        ]
+        missing = [key for key, value in zip(keys, values) if value is _MISSING]
+        if not missing:
+            return values
+
+        epoch = self._epoch
+        fetched = dict(zip(missing, await client.mget(missing)))
+        for key, value in fetched.items():
+            if self.tracks(key):
+                self._store(key, value, epoch)
+        return [
+            fetched[key] if value is _MISSING else value
+            for key, value in zip(keys, values)
+        ]
+
+    def invalidate(self, keys: list[str] | None) -> None:
+        """Drop keys, or everything for None (FLUSHALL, reconnect)."""
+        self._epoch += 1
+        if keys is None:
+            self._entries.clear()
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def run(self, **connection_kwargs) -> None:
+        """Keep the tracking connection open; runs for the app's lifetime."""
+        while True:
+            connection = Connection(
+                **connection_kwargs,
+                protocol=3,
+                # hiredis would be kept otherwise, and it drops push messages
+                parser_class=_AsyncRESP3Parser,
+                decode_responses=True,
+                socket_timeout=None,
+            )
+            try:
+                await connection.connect()
+                # redis-py exposes no public hook for invalidation pushes
+                connection._parser.set_invalidation_push_handler(self._on_push)
+                prefixes = [arg for p in self.prefixes for arg in ("PREFIX", p)]
+                await connection.send_command(
+                    "CLIENT", "TRACKING", "ON", "BCAST", *prefixes
+                )
+                await connection.read_response()
+                self.invalidate(None)
+                self.active = True
+                logger.info("Redis client tracking enabled for %s", self.prefixes)
+                while True:
+                    await connection.read_response(push_request=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Redis client tracking failed: %s", e)
+            finally:
+                self.active = False
+                self.invalidate(None)
+                await connection.disconnect()
+            await asyncio.sleep(1)
+
+    async def _on_push(self, response: list) -> list:
+        # ["invalidate", [keys]], or ["invalidate", None] after a flush
+        self.invalidate(response[1])
+        return response
+
+    def _lookup(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: str, value: Any, epoch: int) -> None:
+        if epoch != self._epoch or not self.active:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
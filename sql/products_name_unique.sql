@@ -0,0 +1,14 @@
+-- products.name must be unique for PUT /products/by_name/{name} and
+-- PUT /products/bulk, which upsert with INSERT ... ON CONFLICT (name).
+-- New databases get the constraint from the model; run this once on an
+-- existing one. It fails on duplicate names, list them first with:
+--   SELECT name, count(*) FROM products GROUP BY name HAVING count(*) > 1;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'products'::regclass AND conname = 'products_name_key'
+    ) THEN
+        ALTER TABLE products ADD CONSTRAINT products_name_key UNIQUE (name);
+    END IF;
+END $$;
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from uuid import uuid4
+
+import pytest
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from redis_conf.tracking import TrackingCache
+
+REDIS_KWARGS = {
+    "host": os.environ.get("REDIS__HOST", "localhost"),
+    "port": int(os.environ.get("REDIS__PORT", 6379)),
+    "password": os.environ.get("REDIS__PASSWORD") or None,
+}
+
+
+def _redis_available() -> bool:
+    client = SyncRedis(**REDIS_KWARGS, socket_connect_timeout=0.5)
+    try:
+        return client.ping()
+    except RedisError:
+        return False
+    finally:
+        client.close()
+
+
+pytestmark = pytest.mark.skipif(
+    not _redis_available(), reason="needs a reachable redis-server (6+)"
+)
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+async def write(other: Redis, tracking: TrackingCache, key: str, value: str) -> None:
+    """SET from another client and wait for the invalidation push."""
+    epoch = tracking._epoch
+    await other.set(key, value)
+    await wait_until(lambda: tracking._epoch > epoch)
+
+
+@asynccontextmanager
+async def tracked():
+    """(tracking cache, its client, another client, key prefix, connection name)."""
+    name = f"tracking-test-{uuid4().hex}"
+    prefix = f"{name}:"
+    tracking = TrackingCache([prefix], max_entries=100, ttl=60)
+    task = asyncio.create_task(tracking.run(**REDIS_KWARGS, client_name=name))
+    client = Redis(**REDIS_KWARGS, decode_responses=True)
+    other = Redis(**REDIS_KWARGS, decode_responses=True)
+    try:
+        await wait_until(lambda: tracking.active)
+        yield tracking, client, other, prefix, name
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        keys = await other.keys(f"{prefix}*")
+        if keys:
+            await other.delete(*keys)
+        await client.aclose()
+        await other.aclose()
+
+
+class WriteDuringRead:
+    """Client whose GET is overtaken by another client's write to the key."""
+
+    def __init__(self, client: Redis, other: Redis, tracking: TrackingCache) -> None:
+        self.client = client
+        self.other = other
+        self.tracking = tracking
+
+    async def get(self, key: str):
+        value = await self.client.get(key)
+        await write(self.other, self.tracking, key, "new")
+        return value
+
+
+def test_write_from_another_client_invalidates_local_copy():
+    async def scenario():
+        async with tracked() as (tracking, client, other, prefix, _):
+            key = f"{prefix}a"
+            await write(other, tracking, key, "1")
+            assert await tracking.get(client, key) == "1"
+            assert key in tracking._entries
+
+            await write(other, tracking, key, "2")
+            assert key not in tracking._entries
+            assert await tracking.get(client, key) == "2"
+
+    asyncio.run(scenario())
+
+
+def test_read_overlapping_invalidation_is_not_stored():
+    async def scenario():
+        async with tracked() as (tracking, client, other, prefix, _):
+            key = f"{prefix}b"
+            await write(other, tracking, key, "old")
+            racy = WriteDuringRead(client, other, tracking)
+
+            assert await tracking.get(racy, key) == "old"
+            assert key not in tracking._entries
+            assert await tracking.get(client, key) == "new"
+
+    asyncio.run(scenario())
+
+
+def test_reconnect_clears_and_bypasses_local_copies():
+    async def scenario():
+        async with tracked() as (tracking, client, other, prefix, name):
+            key = f"{prefix}c"
+            await write(other, tracking, key, "1")
+            assert await tracking.get(client, key) == "1"
+            assert key in tracking._entries
+
+            connection = next(c for c in await other.client_list() if c["name"] == name)
+            await other.client_kill_filter(_id=connection["id"])
+            await wait_until(lambda: not tracking.active)
+            assert not tracking._entries
+
+            # no pushes arrive while disconnected: reads must go to Redis
+            await other.set(key, "2")
+            assert await tracking.get(client, key) == "2"
+            assert key not in tracking._entries
+
+            await wait_until(lambda: tracking.active, timeout=5.0)
+            assert await tracking.get(client, key) == "2"
+            assert key in tracking._entries
+
+    asyncio.run(scenario())